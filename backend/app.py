@@ -4,9 +4,12 @@
 import os
 import sys
 import json
+from contextlib import asynccontextmanager
 from typing import Optional
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -19,6 +22,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the LangChain agent
 from agent import get_agent
+from dashboard import build_dashboard, current_weather, stream_dashboard
+from push import push_hub
+from http_cache import ResponseValidators, conditional_get
+from http_encoding import CompressionMiddleware, FastJSONResponse, FastJSONRoute
 
 # Import individual tool functions from refactored modules
 from tools.entertainment_tools import (
@@ -43,13 +50,105 @@ from tools.medium_tools import get_medium_trending
 from tools.local_news_tools import get_local_news
 from tools.github_tools import get_github_trending
 from tools.tech_news_tools import get_tech_news, get_trending_videos
+from tools.http_client import open_clients, close_clients
+from tools.bulkhead import bulkhead_stats
+from tools.circuit_breaker import breaker_stats
+from tools.deadline import deadline
+from tools.rate_limit import rate_limit_stats
+from tools.utils import start_cache_sweeper, stop_cache_sweeper, cache_stats
+from tools import metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared upstream connection pool, cache sweeper and push hub on startup; close them on shutdown."""
+    open_clients()
+    start_cache_sweeper()
+    push_hub.start()
+    yield
+    await push_hub.stop()
+    stop_cache_sweeper()
+    await close_clients()
+
 
 app = FastAPI(
     title="My Daily Log API",
     description="AI-powered agent using LangChain with Groq for daily information",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
-
+# Set before any route is declared: dict/list results skip jsonable_encoder (see http_encoding.py)
+app.router.route_class = FastJSONRoute
+
+# Latency budgets (seconds) per route. Once a route's budget is spent, the
+# fetch layer stops waiting on upstreams: the endpoint answers with cached
+# (possibly expired) or default data while the fetch finishes in the
+# background and refreshes the cache for the next request. Routes that run
+# the LLM agent (e.g. /api/github) get no budget: planning alone would spend
+# it, and the agent's tool calls would then start past their deadline.
+ROUTE_LATENCY_BUDGETS = {
+    "/api/books/trending": 0.3,
+    "/api/quotes/daily": 0.3,
+    "/api/weather": 0.5,
+    "/api/github/trending": 1.0,
+    "/api/news/google": 1.0,
+    "/api/tech/trending": 1.0,
+}
+
+
+@app.middleware("http")
+async def latency_budget(request, call_next):
+    """Apply the route's latency budget as a deadline for every upstream fetch it makes."""
+    budget = ROUTE_LATENCY_BUDGETS.get(request.url.path)
+    if budget is None:
+        return await call_next(request)
+    with deadline(budget):
+        return await call_next(request)
+
+
+# Browser/CDN caching per route: (max-age, stale-while-revalidate) in seconds.
+# GET /api/* routes not listed use HTTP_CACHE_DEFAULT; HTTP_NO_STORE routes
+# are never cached and streams are passed through untouched. Every cached
+# route gets an ETag and Last-Modified and answers conditional requests with 304.
+# The max-age only applies to responses built from fresh upstream data; the
+# rest (possibly fallback data) are sent with no-cache (see http_cache.py).
+HTTP_CACHE_DEFAULT = (60, 300)
+HTTP_CACHE_CONTROL = {
+    "/api/weather": (300, 900),
+    "/api/quotes/daily": (3600, 86400),
+    "/api/books/trending": (1800, 3600),
+    "/api/github": (600, 1800),
+    "/api/github/trending": (600, 1800),
+    "/api/events/nearby": (600, 1800),
+    "/api/dashboard": (60, 300),
+    "/api/news": (120, 600),
+    "/api/news/google": (120, 600),
+    "/api/tech/trending": (120, 600),
+}
+HTTP_NO_STORE = {"/api/query", "/api/cache/stats", "/api/upstreams", "/api/metrics"}
+HTTP_PASSTHROUGH = {"/api/dashboard/stream"}
+_response_validators = ResponseValidators()
+
+
+@app.middleware("http")
+async def http_validators(request, call_next):
+    """Add ETag / Last-Modified / Cache-Control to API GETs and answer conditional requests with 304."""
+    path = request.url.path
+    if request.method != "GET" or not path.startswith("/api/") or path in HTTP_PASSTHROUGH:
+        return await call_next(request)
+    if path in HTTP_NO_STORE:
+        response = await call_next(request)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    max_age, stale = HTTP_CACHE_CONTROL.get(path, HTTP_CACHE_DEFAULT)
+    cache_control = f"public, max-age={max_age}, stale-while-revalidate={stale}"
+    return await conditional_get(request, call_next, cache_control, _response_validators)
+
+
+# Middleware added later wraps what was added before. CORS goes around
+# http_validators and latency_budget so their short-circuit responses
+# (cached 304s) still carry the CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -58,6 +157,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it is outermost: compresses the tagged responses and 304s from http_validators
+HTTP_COMPRESS_MIN_BYTES = int(os.getenv("HTTP_COMPRESS_MIN_BYTES", "1024"))
+app.add_middleware(CompressionMiddleware, minimum_size=HTTP_COMPRESS_MIN_BYTES)
+
+
 class QueryRequest(BaseModel):
     query: str
 
@@ -73,6 +177,9 @@ async def home():
             "query": "/api/query?q=<your_question>",
             "news": "/api/news?topic=<topic>",
             "weather": "/api/weather",
+            "dashboard": "/api/dashboard",
+            "dashboard_stream": "/api/dashboard/stream?format=<sse|ndjson>",
+            "updates": "ws://<host>/ws/updates",
             "trends": "/api/trends",
             "github": "/api/github?language=<language>",
         },
@@ -92,7 +199,7 @@ async def query_get(q: str = Query(..., description="Your question")):
     """Universal query endpoint using LangChain agent (GET)."""
     try:
         agent = get_agent()
-        response = agent.run(q)
+        response = await run_in_threadpool(agent.run, q)
         
         return {
             "success": True,
@@ -107,7 +214,7 @@ async def query_post(request: QueryRequest):
     """Universal query endpoint using LangChain agent (POST)."""
     try:
         agent = get_agent()
-        response = agent.run(request.query)
+        response = await run_in_threadpool(agent.run, request.query)
         
         return {
             "success": True,
@@ -124,9 +231,9 @@ async def news(topic: Optional[str] = None, country: str = "US"):
     try:
         agent = get_agent()
         if topic:
-            response = agent.run(f"Get {topic} news from {country}")
+            response = await run_in_threadpool(agent.run, f"Get {topic} news from {country}")
         else:
-            response = agent.run(f"Get top news from {country}")
+            response = await run_in_threadpool(agent.run, f"Get top news from {country}")
         
         return {
             "success": True,
@@ -141,70 +248,45 @@ async def news(topic: Optional[str] = None, country: str = "US"):
 @app.get("/api/weather")
 async def weather():
     """Get local weather with caching and fallback."""
-    import httpx
-    import time
-    
-    # Simple cache with 5-minute TTL
-    cache_key = "weather_data"
-    cache_ttl_key = "weather_ttl"
-    
-    # Check cache
-    if hasattr(weather, '_cache') and cache_key in weather._cache:
-        if time.time() < weather._cache.get(cache_ttl_key, 0):
-            return weather._cache[cache_key]
-    
-    try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get("https://wttr.in/?format=j1")
-            response.raise_for_status()
-            data = response.json()
-        
-        current = data.get("current_condition", [{}])[0]
-        
-        result = {
-            "success": True,
-            "data": {
-                "condition": current.get("weatherDesc", [{}])[0].get("value", "Unknown"),
-                "temp_c": current.get("temp_C", "0"),
-                "temp_f": current.get("temp_F", "0"),
-                "feels_like_c": current.get("FeelsLikeC", "0"),
-                "feels_like_f": current.get("FeelsLikeF", "0"),
-                "humidity": current.get("humidity", "0")
-            }
-        }
-        
-        # Cache result for 5 minutes (300 seconds)
-        if not hasattr(weather, '_cache'):
-            weather._cache = {}
-        weather._cache[cache_key] = result
-        weather._cache[cache_ttl_key] = time.time() + 300
-        
-        return result
-    except Exception as e:
-        # Return cached data if available, even if expired
-        if hasattr(weather, '_cache') and cache_key in weather._cache:
-            return weather._cache[cache_key]
-        
-        # Fallback to mock weather data
-        result = {
-            "success": True,
-            "data": {
-                "condition": "Partly Cloudy",
-                "temp_c": "20",
-                "temp_f": "68",
-                "feels_like_c": "19",
-                "feels_like_f": "66",
-                "humidity": "65"
-            }
-        }
-        
-        # Cache fallback for 5 minutes
-        if not hasattr(weather, '_cache'):
-            weather._cache = {}
-        weather._cache[cache_key] = result
-        weather._cache[cache_ttl_key] = time.time() + 300
-        
-        return result
+    return {
+        "success": True,
+        "data": await current_weather()
+    }
+
+
+@app.get("/api/dashboard")
+async def dashboard():
+    """Get every home-page section in one response, fetched concurrently.
+
+    Each section has its own latency budget (DASHBOARD_SECTION_TIMEOUTS); a
+    section that fails or runs out of time has null data and is listed in
+    "errors", and the rest of the dashboard is still returned. Section
+    timings are sent in the Server-Timing header.
+    """
+    document, timings = await build_dashboard()
+    server_timing = ", ".join(f"{name};dur={ms}" for name, ms in timings.items())
+    return FastJSONResponse(document, headers={"Server-Timing": server_timing})
+
+
+@app.get("/api/dashboard/stream")
+async def dashboard_stream(format: str = Query("sse", pattern="^(sse|ndjson)$")):
+    """Stream home-page sections as each one finishes, then a summary with timings.
+
+    format=sse sends Server-Sent Events ("section" events, then "summary");
+    format=ndjson sends one JSON object per line with a "type" field.
+    """
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/event-stream"
+    return StreamingResponse(stream_dashboard(format), media_type=media_type,
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.websocket("/ws/updates")
+async def updates(websocket: WebSocket):
+    """Push channel: subscribe to sections or feeds and receive their data only when it changes.
+
+    See push.py for the topics and message format.
+    """
+    await push_hub.serve(websocket)
 
 
 @app.get("/api/trends")
@@ -212,7 +294,7 @@ async def trends():
     """Get various trends using the agent."""
     try:
         agent = get_agent()
-        response = agent.get_trends()
+        response = await run_in_threadpool(agent.get_trends)
         
         return {
             "success": True,
@@ -229,9 +311,9 @@ async def github_trending(language: Optional[str] = None):
         agent = get_agent()
         
         if language:
-            response = agent.run(f"Show me trending {language} repositories on GitHub")
+            response = await run_in_threadpool(agent.run, f"Show me trending {language} repositories on GitHub")
         else:
-            response = agent.run("Show me trending repositories on GitHub")
+            response = await run_in_threadpool(agent.run, "Show me trending repositories on GitHub")
         
         return {
             "success": True,
@@ -265,13 +347,46 @@ async def agent_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/cache/stats")
+async def cache_statistics():
+    """Get memory use of the upstream response cache."""
+    return {
+        "success": True,
+        "data": cache_stats()
+    }
+
+
+@app.get("/api/upstreams")
+async def upstream_health():
+    """Get circuit breaker state, recent latency, concurrency and remaining quota for each upstream host."""
+    hosts = breaker_stats()
+    for host, bulkhead in bulkhead_stats().items():
+        hosts.setdefault(host, {})["bulkhead"] = bulkhead
+    for host, quota in rate_limit_stats().items():
+        hosts.setdefault(host, {})["quota"] = quota
+    return {
+        "success": True,
+        "data": hosts
+    }
+
+
+@app.get("/api/metrics")
+async def fetch_metrics():
+    """Get fetch-layer counters (revalidations, fallbacks, ...) and push channel gauges."""
+    push = {f"push.{name}": value for name, value in push_hub.stats().items()}
+    return {
+        "success": True,
+        "data": {**metrics.snapshot(), **push}
+    }
+
+
 # Backward compatibility endpoints for old frontend
 @app.get("/api/medium/trending")
 async def medium_trending():
     """Get Medium trending stories (backward compatibility)."""
     try:
         from tools.news_tools import get_medium_trending
-        result = get_medium_trending.invoke({})
+        result = await get_medium_trending.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -285,7 +400,7 @@ async def articles_medium():
     """Get Medium trending stories."""
     try:
         from tools.news_tools import get_medium_trending
-        result = get_medium_trending.invoke({})
+        result = await get_medium_trending.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -299,7 +414,7 @@ async def articles_devto(tag: Optional[str] = None):
     """Get Dev.to trending stories."""
     try:
         from tools.news_tools import get_devto_trending
-        result = get_devto_trending.invoke({"tag": tag} if tag else {})
+        result = await get_devto_trending.ainvoke({"tag": tag} if tag else {})
         return {
             "success": True,
             "data": result
@@ -313,7 +428,7 @@ async def articles_hashnode():
     """Get Hashnode trending stories."""
     try:
         from tools.news_tools import get_hashnode_trending
-        result = get_hashnode_trending.invoke({})
+        result = await get_hashnode_trending.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -327,7 +442,7 @@ async def articles_hackernews():
     """Get Hacker News top stories."""
     try:
         from tools.news_tools import get_hackernews_top
-        result = get_hackernews_top.invoke({})
+        result = await get_hackernews_top.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -341,7 +456,7 @@ async def articles_reddit():
     """Get Reddit programming stories."""
     try:
         from tools.news_tools import get_reddit_programming
-        result = get_reddit_programming.invoke({})
+        result = await get_reddit_programming.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -355,7 +470,7 @@ async def google_news(topic: Optional[str] = None):
     """Get Google News (backward compatibility)."""
     try:
         from tools.news_tools import get_google_news
-        result = get_google_news.invoke({"topic": topic} if topic else {})
+        result = await get_google_news.ainvoke({"topic": topic} if topic else {})
         return {
             "success": True,
             "data": result
@@ -369,7 +484,7 @@ async def country_news(country: str = "US", lang: str = "en"):
     """Get country-specific news (Google News RSS)."""
     try:
         from tools.news_tools import get_country_news
-        result = get_country_news.invoke({"country": country, "lang": lang})
+        result = await get_country_news.ainvoke({"country": country, "lang": lang})
         return {
             "success": True,
             "data": result
@@ -383,7 +498,7 @@ async def international_news(lang: str = "en", country: str = "US"):
     """Get international/world news (Google News RSS)."""
     try:
         from tools.news_tools import get_international_news
-        result = get_international_news.invoke({"lang": lang, "country": country})
+        result = await get_international_news.ainvoke({"lang": lang, "country": country})
         return {
             "success": True,
             "data": result
@@ -398,7 +513,7 @@ async def local_news(location: Optional[str] = None, country: str = "US", lang:
     try:
         from tools.news_tools import get_local_news
         payload = {"location": location, "country": country, "lang": lang}
-        result = get_local_news.invoke(payload)
+        result = await get_local_news.ainvoke(payload)
         return {
             "success": True,
             "data": result
@@ -412,7 +527,7 @@ async def books_trending():
     """Get trending books (backward compatibility)."""
     try:
         from tools.entertainment_tools import get_trending_books
-        result = get_trending_books.invoke({})
+        result = await get_trending_books.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -426,7 +541,7 @@ async def github_trending_old(language: Optional[str] = None):
     """Get GitHub trending (backward compatibility)."""
     try:
         from tools.tech_tools import get_github_trending
-        result = get_github_trending.invoke({"language": language} if language else {})
+        result = await get_github_trending.ainvoke({"language": language} if language else {})
         return {
             "success": True,
             "data": result
@@ -440,7 +555,7 @@ async def tech_trending():
     """Get tech trending (backward compatibility)."""
     try:
         from tools.tech_tools import get_tech_news
-        result = get_tech_news.invoke({})
+        result = await get_tech_news.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -454,7 +569,7 @@ async def quotes_daily():
     """Get quote of the day (backward compatibility)."""
     try:
         from tools.entertainment_tools import get_quote_of_day
-        result = get_quote_of_day.invoke({})
+        result = await get_quote_of_day.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -468,7 +583,7 @@ async def fashion_trending():
     """Get fashion trending (backward compatibility)."""
     try:
         from tools.entertainment_tools import get_trending_fashion
-        result = get_trending_fashion.invoke({})
+        result = await get_trending_fashion.ainvoke({})
         return {
             "success": True,
             "data": result
@@ -482,7 +597,7 @@ async def shopping_products(store: Optional[str] = None, category: Optional[str]
     """Get shopping products by store and category."""
     try:
         from tools.utility_tools import get_store_products
-        result = get_store_products.invoke({"store": store, "category": category})
+        result = await get_store_products.ainvoke({"store": store, "category": category})
         return {
             "success": True,
             "store": store or "All Stores",
@@ -498,7 +613,7 @@ async def shopping_electronics():
     """Get trending electronics."""
     try:
         from tools.utility_tools import get_store_products
-        result = get_store_products.invoke({"store": None, "category": "electronics"})
+        result = await get_store_products.ainvoke({"store": None, "category": "electronics"})
         return {
             "success": True,
             "category": "Electronics",
@@ -513,7 +628,7 @@ async def shopping_books():
     """Get popular books for shopping."""
     try:
         from tools.utility_tools import get_store_products
-        result = get_store_products.invoke({"store": None, "category": "books"})
+        result = await get_store_products.ainvoke({"store": None, "category": "books"})
         return {
             "success": True,
             "category": "Books",
@@ -528,7 +643,7 @@ async def shopping_clothing():
     """Get trending clothing items."""
     try:
         from tools.utility_tools import get_store_products
-        result = get_store_products.invoke({"store": None, "category": "clothing"})
+        result = await get_store_products.ainvoke({"store": None, "category": "clothing"})
         return {
             "success": True,
             "category": "Clothing",
@@ -543,7 +658,7 @@ async def gas_prices(zipcode: Optional[str] = None):
     """Get cheapest gas prices nearby."""
     try:
         from tools.utility_tools import get_cheapest_gas
-        result = get_cheapest_gas.invoke({"zipcode": zipcode})
+        result = await get_cheapest_gas.ainvoke({"zipcode": zipcode})
         return {
             "success": True,
             "location": zipcode or "Current Location",
@@ -569,7 +684,7 @@ async def events_nearby(
             "unit": unit,
             "category": category,
         }
-        result = get_events_nearby.invoke(payload)
+        result = await get_events_nearby.ainvoke(payload)
         return {
             "success": True,
             "data": result,
@@ -583,7 +698,7 @@ async def gas_cheapest(zipcode: Optional[str] = None):
     """Get the cheapest gas station nearby."""
     try:
         from tools.utility_tools import get_cheapest_gas
-        result = get_cheapest_gas.invoke({"zipcode": zipcode})
+        result = await get_cheapest_gas.ainvoke({"zipcode": zipcode})
         if result and len(result) > 0:
             # Find the cheapest regular gas
             cheapest = min(result, key=lambda x: float(x.get("regular", "$9.99").strip("$")))
@@ -605,7 +720,7 @@ async def food_restaurants(cuisine: Optional[str] = None):
     """Get best restaurants by cuisine type."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": cuisine})
+        result = await get_best_food.ainvoke({"cuisine": cuisine})
         return {
             "success": True,
             "cuisine": cuisine or "All",
@@ -620,7 +735,7 @@ async def food_italian():
     """Get Italian restaurants."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": "italian"})
+        result = await get_best_food.ainvoke({"cuisine": "italian"})
         return {
             "success": True,
             "cuisine": "Italian",
@@ -635,7 +750,7 @@ async def food_asian():
     """Get Asian restaurants."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": "asian"})
+        result = await get_best_food.ainvoke({"cuisine": "asian"})
         return {
             "success": True,
             "cuisine": "Asian",
@@ -650,7 +765,7 @@ async def food_thai():
     """Get Thai restaurants."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": "thai"})
+        result = await get_best_food.ainvoke({"cuisine": "thai"})
         return {
             "success": True,
             "cuisine": "Thai",
@@ -665,7 +780,7 @@ async def food_chinese():
     """Get Chinese restaurants."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": "chinese"})
+        result = await get_best_food.ainvoke({"cuisine": "chinese"})
         return {
             "success": True,
             "cuisine": "Chinese",
@@ -680,7 +795,7 @@ async def food_indian():
     """Get Indian restaurants."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": "indian"})
+        result = await get_best_food.ainvoke({"cuisine": "indian"})
         return {
             "success": True,
             "cuisine": "Indian",
@@ -695,7 +810,7 @@ async def food_vegan():
     """Get Vegan restaurants."""
     try:
         from tools.entertainment_tools import get_best_food
-        result = get_best_food.invoke({"cuisine": "vegan"})
+        result = await get_best_food.ainvoke({"cuisine": "vegan"})
         return {
             "success": True,
             "cuisine": "Vegan",
@@ -710,7 +825,7 @@ async def social_twitter():
     """Get trending content from Twitter/X (uses tech news as placeholder)."""
     try:
         from tools.tech_tools import get_tech_news
-        result = get_tech_news.invoke({})
+        result = await get_tech_news.ainvoke({})
         return {
             "success": True,
             "source": "twitter",
@@ -725,7 +840,7 @@ async def social_linkedin():
     """Get trending content from LinkedIn (uses tech news as placeholder)."""
     try:
         from tools.tech_tools import get_tech_news
-        result = get_tech_news.invoke({})
+        result = await get_tech_news.ainvoke({})
         return {
             "success": True,
             "source": "linkedin",
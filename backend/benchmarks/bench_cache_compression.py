@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Hit-path cost and memory savings of compressed cold entries (tools/cache.py).
+
+Fills a TTLCache with payloads shaped like the cached upstream data (parsed
+feed item tuples, GitHub search JSON, TMDB-style result lists), compresses
+them with compress_idle(), and reports:
+
+  * bytes held before and after compression
+  * get() latency for a hot entry, and for the first read of a compressed
+    entry, which decompresses it and stores it uncompressed again
+
+Usage: python benchmarks/bench_cache_compression.py [--entries 300] [--repeat 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.cache import TTLCache, zstandard
+
+
+def feed_items(i: int):
+    return tuple(
+        {"title": f"Headline {i}-{n}: something happened in tech today", "pubDate": "Mon, 02 Feb 2026 10:00:00 GMT",
+         "link": f"https://news.example.com/articles/{i}/{n}?utm_source=rss&utm_medium=feed"}
+        for n in range(25)
+    )
+
+
+def github_search(i: int):
+    return {"total_count": 1000, "incomplete_results": False, "items": [
+        {"full_name": f"owner{i}/repo{n}", "description": "A fast, small library for doing useful things " * 2,
+         "stargazers_count": 1000 + n, "language": "Python", "html_url": f"https://github.com/owner{i}/repo{n}",
+         "topics": ["python", "cli", "performance"], "license": {"key": "mit", "name": "MIT License"}}
+        for n in range(30)
+    ]}
+
+
+def tmdb_results(i: int):
+    return {"page": 1, "results": [
+        {"id": i * 100 + n, "title": f"Movie {n}", "overview": "An epic story about people and things. " * 4,
+         "release_date": "2026-01-01", "vote_average": 7.5, "popularity": 100.0 + n, "genre_ids": [12, 28]}
+        for n in range(20)
+    ]}
+
+
+SHAPES = {"feed": feed_items, "github": github_search, "tmdb": tmdb_results}
+
+
+def time_get(cache: TTLCache, keys, repeat: int) -> float:
+    """Mean seconds per get() over repeat reads cycling through keys."""
+    began = time.perf_counter()
+    for n in range(repeat):
+        cache.get(keys[n % len(keys)])
+    return (time.perf_counter() - began) / repeat
+
+
+def run(shape: str, entries: int, repeat: int):
+    make = SHAPES[shape]
+    cache = TTLCache(max_bytes=1024 * 1024 * 1024, stripes=16, compress_after=1, compress_min_bytes=1024)
+    keys = [f"json:{shape}/{i}" for i in range(entries)]
+    for i, key in enumerate(keys):
+        cache.set(key, make(i), ttl=3600, namespace=shape)
+    hot_bytes = cache.stats()["bytes"]
+    hot = time_get(cache, keys, repeat)
+
+    cache.compress_idle(now=time.time() + 10)
+    cold_bytes = cache.stats()["bytes"]
+    # Each key's first read decompresses it; time exactly one read per key
+    began = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    first_read = (time.perf_counter() - began) / len(keys)
+    stats = cache.stats()
+    return {
+        "shape": shape,
+        "hot_bytes": hot_bytes,
+        "cold_bytes": cold_bytes,
+        "hot_get_us": hot * 1e6,
+        "cold_get_us": first_read * 1e6,
+        "decompressions": stats["decompressions"],
+        "rehydrated_bytes": stats["bytes"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"codec: {'zstd' if zstandard is not None else 'zlib'}, {args.entries} entries per shape\n")
+    print(f"{'shape':<8} {'hot KiB':>9} {'cold KiB':>9} {'ratio':>6} {'hot get':>9} {'cold get':>10}")
+    failed = False
+    for shape in SHAPES:
+        result = run(shape, args.entries, args.repeat)
+        print(f"{result['shape']:<8} {result['hot_bytes'] / 1024:>9.0f} {result['cold_bytes'] / 1024:>9.0f} "
+              f"{result['hot_bytes'] / result['cold_bytes']:>5.1f}x {result['hot_get_us']:>7.2f}us "
+              f"{result['cold_get_us']:>8.1f}us")
+        # Every compressed entry must come back exactly once and be re-accounted at full size
+        failed = failed or result["decompressions"] != args.entries or result["rehydrated_bytes"] != result["hot_bytes"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for the fetch cache (tools/cache.py).
+
+Hammers a TTLCache from many threads with a read-heavy mix of get/set/sweep
+and compares throughput for a single lock against lock striping. After each
+run it checks that per-segment byte and namespace accounting still matches
+the stored entries, and reports any exception raised by a worker.
+
+Usage: python benchmarks/bench_cache_contention.py [--threads 32] [--ops 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.cache import TTLCache
+
+
+def worker(cache: TTLCache, keys, ops: int, seed: int, errors: list, start: threading.Event):
+    rng = random.Random(seed)
+    payload = "x" * 512
+    start.wait()
+    try:
+        for i in range(ops):
+            key = rng.choice(keys)
+            roll = rng.random()
+            if roll < 0.85:
+                cache.get(key)
+            elif roll < 0.99:
+                cache.set(key, payload, ttl=rng.uniform(0.001, 0.05), stale_window=0.01,
+                          namespace=key.split(":", 1)[0])
+            else:
+                cache.sweep()
+    except Exception as e:
+        errors.append(repr(e))
+
+
+def check_accounting(cache: TTLCache) -> bool:
+    """Every segment's byte and namespace totals must match its entries."""
+    for segment in cache._segments:
+        with segment.lock:
+            if segment.bytes != sum(entry.size for entry in segment.entries.values()):
+                return False
+            if sum(c["entries"] for c in segment.namespaces.values()) != len(segment.entries):
+                return False
+    return True
+
+
+def run(stripes: int, threads: int, ops: int, key_count: int):
+    cache = TTLCache(max_bytes=8 * 1024 * 1024, stripes=stripes)
+    keys = [f"ns{i % 8}:https://example.com/feed/{i}" for i in range(key_count)]
+    errors = []
+    start = threading.Event()
+    pool = [
+        threading.Thread(target=worker, args=(cache, keys, ops, seed, errors, start))
+        for seed in range(threads)
+    ]
+    for t in pool:
+        t.start()
+    began = time.perf_counter()
+    start.set()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - began
+    return {
+        "stripes": stripes,
+        "ops_per_sec": threads * ops / elapsed,
+        "elapsed": elapsed,
+        "errors": errors,
+        "consistent": check_accounting(cache),
+        "entries": len(cache),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.ops} ops over {args.keys} keys\n")
+    print(f"{'stripes':>8} {'ops/sec':>12} {'elapsed':>9} {'entries':>8}  consistent  errors")
+    failed = False
+    for stripes in (1, 4, 16, 64):
+        result = run(stripes, args.threads, args.ops, args.keys)
+        print(f"{result['stripes']:>8} {result['ops_per_sec']:>12,.0f} {result['elapsed']:>8.2f}s "
+              f"{result['entries']:>8}  {str(result['consistent']):>10}  {len(result['errors'])}")
+        for error in result["errors"][:3]:
+            print(f"    {error}")
+        failed = failed or bool(result["errors"]) or not result["consistent"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
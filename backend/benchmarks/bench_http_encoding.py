@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Serialization cost and bytes on the wire of the largest API responses (http_encoding.py).
+
+Builds payloads shaped like the biggest responses, using the tools' own
+formatters on synthetic upstream data:
+
+  * /api/food/restaurants   (Yelp businesses through _format_restaurants)
+  * /api/shopping/products  (get_store_products)
+  * /api/dashboard          (every home section in one document)
+
+For each it reports:
+
+  * encode time of FastAPI's default path (jsonable_encoder + stdlib json)
+    and of FastJSONResponse (orjson when installed)
+  * response size uncompressed, gzipped and brotli-compressed (if brotli is
+    installed), with the time each compression takes
+
+--scale multiplies list lengths to see how the costs grow with bigger pages.
+
+Usage: python benchmarks/bench_http_encoding.py [--scale 1] [--repeat 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+
+from http_encoding import brotli, compress, dumps, orjson
+from tools.entertainment_tools import _format_restaurants
+from tools.events_tools import _format_events
+from tools.tech_tools import _format_repos
+from tools.utility_tools import _get_default_gas_stations, get_store_products
+
+
+def yelp_businesses(n: int):
+    return {"businesses": [
+        {"name": f"Restaurant {i}", "rating": 4.5, "review_count": 1200 + i, "price": "$$",
+         "location": {"display_address": [f"{100 + i} Example Street", "New York, NY 10001"]},
+         "phone": "+12125550100",
+         "url": f"https://www.yelp.com/biz/restaurant-{i}-new-york?adjust_creative=abc&utm_campaign=yelp_api_v3"}
+        for i in range(n)
+    ]}
+
+
+def feed_items(n: int):
+    return [{"title": f"Headline {i}: something happened in tech today", "pubDate": "Mon, 02 Feb 2026 10:00:00 GMT",
+             "link": f"https://news.example.com/articles/{i}?utm_source=rss&utm_medium=feed"} for i in range(n)]
+
+
+def github_items(n: int):
+    return {"items": [
+        {"full_name": f"owner/repo{i}", "description": "A fast, small library for doing useful things",
+         "stargazers_count": 1000 + i, "language": "Python", "html_url": f"https://github.com/owner/repo{i}"}
+        for i in range(n)
+    ]}
+
+
+def ticketmaster_events(n: int):
+    return {"_embedded": {"events": [
+        {"name": f"Concert {i}", "url": f"https://www.ticketmaster.com/event/{i:016X}",
+         "dates": {"start": {"localDate": "2026-03-01", "localTime": "20:00:00"}},
+         "_embedded": {"venues": [{"name": "Madison Square Garden", "city": {"name": "New York"},
+                                   "country": {"countryCode": "US"}}]}}
+        for i in range(n)
+    ]}}
+
+
+def restaurants(scale: int):
+    return {"success": True, "cuisine": "All", "data": _format_restaurants(yelp_businesses(10 * scale), None)}
+
+
+def shopping(scale: int):
+    return {"success": True, "store": "All Stores", "category": "All",
+            "data": get_store_products.invoke({"store": None, "category": None}) * scale}
+
+
+def dashboard(scale: int):
+    return {
+        "success": True,
+        "data": {
+            "weather": {"condition": "Partly Cloudy", "temp_c": "20", "temp_f": "68", "feels_like_c": "19",
+                        "feels_like_f": "66", "humidity": "65"},
+            "news": feed_items(10 * scale),
+            "quote": {"text": "Stay hungry, stay foolish.", "author": "Steve Jobs"},
+            "books": [{"title": f"Book {i}", "authors": ["An Author"], "year": 2020 + i % 5} for i in range(10 * scale)],
+            "articles": feed_items(10 * scale),
+            "github": _format_repos(github_items(10 * scale)),
+            "fashion": feed_items(5 * scale),
+            "shopping": get_store_products.invoke({"store": None, "category": None}) * scale,
+            "gas": _get_default_gas_stations(None) * scale,
+            "food": _format_restaurants(yelp_businesses(10 * scale), None),
+            "events": _format_events(ticketmaster_events(15 * scale), "New York, NY", "music"),
+        },
+        "errors": {},
+    }
+
+
+PAYLOADS = {"restaurants": restaurants, "shopping": shopping, "dashboard": dashboard}
+
+
+def fastapi_default(content) -> bytes:
+    """What FastAPI does for a dict returned without a response model: jsonable_encoder, then JSONResponse.render."""
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def time_it(fn, repeat: int) -> float:
+    """Mean seconds per call over repeat calls."""
+    began = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - began) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"encoder: {'orjson' if orjson is not None else 'stdlib json'}, "
+          f"compression: gzip{', brotli' if brotli is not None else ' (brotli not installed)'}\n")
+    print(f"{'payload':<12} {'default':>9} {'fast':>9} {'speedup':>8} {'bytes':>8} {'gzip':>14} {'br':>14}")
+    failed = False
+    for name, build in PAYLOADS.items():
+        content = build(args.scale)
+        default_body, fast_body = fastapi_default(content), dumps(content)
+        # Both encoders must produce the same document
+        failed = failed or json.loads(default_body) != json.loads(fast_body)
+        default_s = time_it(lambda: fastapi_default(content), args.repeat)
+        fast_s = time_it(lambda: dumps(content), args.repeat)
+        sizes = {}
+        for encoding in ("gzip", "br"):
+            if encoding == "br" and brotli is None:
+                sizes[encoding] = "-"
+                continue
+            compressed = compress(fast_body, encoding)
+            seconds = time_it(lambda: compress(fast_body, encoding), max(1, args.repeat // 10))
+            sizes[encoding] = f"{len(compressed)} {seconds * 1e6:.0f}us"
+        print(f"{name:<12} {default_s * 1e6:>7.1f}us {fast_s * 1e6:>7.1f}us {default_s / fast_s:>7.1f}x "
+              f"{len(fast_body):>8} {sizes['gzip']:>14} {sizes['br']:>14}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for parse_rss (tools/utils.py).
+
+Compares the streaming, limit-aware parser against the previous DOM-based
+implementation (ET.fromstring + findall, kept below as legacy_parse_rss) on
+large feeds, reporting time per parse and peak memory (tracemalloc).
+
+By default it generates RSS 2.0 and Atom feeds of a few sizes; pass recorded
+feeds with --feed path/to/feed.xml (repeatable) to benchmark real documents.
+
+Usage: python benchmarks/bench_parse_rss.py [--feed FILE ...] [--limit 10] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.utils import parse_rss
+
+
+def legacy_parse_rss(xml_text):
+    """The DOM-based parse_rss this module replaced (RSS 2.0 only, no limit)."""
+    root = ET.fromstring(xml_text)
+    channel = root.find("channel")
+    if not channel:
+        for child in root:
+            if "channel" in child.tag:
+                channel = child
+                break
+    items = []
+    if channel:
+        for item in channel.findall("item") or []:
+            title_el = item.find("title")
+            link_el = item.find("link")
+            pub_el = item.find("pubDate")
+            items.append({
+                "title": title_el.text if title_el is not None else "",
+                "link": link_el.text if link_el is not None else "",
+                "pubDate": pub_el.text if pub_el is not None else "",
+            })
+    return items
+
+
+def make_rss(count: int) -> bytes:
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>Mon, 02 Feb 2026 10:00:00 GMT</pubDate><guid>{i}</guid>"
+        f"<description><![CDATA[{body}]]></description></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Bench</title>{items}</channel></rss>'.encode()
+
+
+def make_atom(count: int) -> bytes:
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    entries = "".join(
+        f'<entry><title>Post {i}</title><link href="https://example.com/{i}"/>'
+        f"<updated>2026-02-02T10:00:00Z</updated><id>{i}</id><content>{body}</content></entry>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Bench</title>{entries}</feed>'.encode()
+
+
+def measure(fn, data, repeat: int):
+    """Return (mean seconds per call, peak traced bytes, items returned)."""
+    result = fn(data)
+    began = time.perf_counter()
+    for _ in range(repeat):
+        fn(data)
+    elapsed = (time.perf_counter() - began) / repeat
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--feed", action="append", default=[], help="recorded feed file to include")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    feeds = [(f"rss x{n}", make_rss(n)) for n in (100, 1000, 5000)]
+    feeds += [(f"atom x{n}", make_atom(n)) for n in (100, 1000)]
+    for path in args.feed:
+        with open(path, "rb") as f:
+            feeds.append((os.path.basename(path), f.read()))
+
+    candidates = [
+        ("legacy DOM", legacy_parse_rss),
+        ("stream", parse_rss),
+        (f"stream limit={args.limit}", lambda data: parse_rss(data, limit=args.limit)),
+    ]
+
+    print(f"{'feed':<16} {'size':>9}  {'parser':<18} {'ms/parse':>9} {'peak KiB':>10} {'items':>6}")
+    for name, data in feeds:
+        for label, fn in candidates:
+            try:
+                elapsed, peak, count = measure(fn, data, args.repeat)
+            except Exception as e:
+                print(f"{name:<16} {len(data) // 1024:>7}KB  {label:<18} failed: {e}")
+                continue
+            print(f"{name:<16} {len(data) // 1024:>7}KB  {label:<18} {elapsed * 1000:>9.2f} "
+                  f"{peak / 1024:>10.0f} {count:>6}")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
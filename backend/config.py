@@ -49,8 +49,161 @@ class APIConfig:
     DEFAULT_LOCATION = os.getenv("DEFAULT_LOCATION", "New York, NY")
     DEFAULT_COUNTRY = os.getenv("DEFAULT_COUNTRY", "US")
     
-    # Timeouts
-    REQUEST_TIMEOUT = 10
+    # Upstream timeout profiles (seconds) by host: "connect" bounds establishing
+    # a connection, "read" the wait for each chunk of the response. Hosts not
+    # listed use HTTP_TIMEOUT_DEFAULT.
+    HTTP_TIMEOUT_DEFAULT = {"connect": 3.0, "read": 5.0}
+    HTTP_TIMEOUT_PROFILES = {
+        "wttr.in": {"connect": 1.0, "read": 2.0},
+        "api.quotable.io": {"connect": 1.0, "read": 2.0},
+        "news.google.com": {"connect": 2.0, "read": 4.0},
+        "hnrss.org": {"connect": 2.0, "read": 4.0},
+        "www.reddit.com": {"connect": 2.0, "read": 4.0},
+        "api.github.com": {"connect": 2.0, "read": 5.0},
+        "www.youtube.com": {"connect": 2.0, "read": 4.0},
+        "openlibrary.org": {"connect": 3.0, "read": 8.0},
+        "api.yelp.com": {"connect": 3.0, "read": 6.0},
+        "app.ticketmaster.com": {"connect": 3.0, "read": 6.0},
+    }
+
+    # Circuit breakers per upstream host: open after this many consecutive
+    # failures, then probe again after the recovery timeout (seconds)
+    BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+    BREAKER_RECOVERY_TIMEOUT = float(os.getenv("BREAKER_RECOVERY_TIMEOUT", "30"))
+
+    # Hedged requests (async fetches only). For these hosts a second attempt is
+    # sent when the first hasn't answered by the host's observed
+    # HEDGE_PERCENTILE latency (once HEDGE_MIN_SAMPLES calls have been timed),
+    # and the faster response wins. Hedges are capped at HEDGE_BUDGET_RATIO of
+    # the host's requests, with bursts of up to HEDGE_BURST.
+    HEDGE_HOSTS = {"wttr.in", "hnrss.org", "api.quotable.io"}
+    HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.05"))
+    HEDGE_BUDGET_RATIO = float(os.getenv("HEDGE_BUDGET_RATIO", "0.1"))
+    HEDGE_BURST = float(os.getenv("HEDGE_BURST", "5"))
+
+    # Quota-limited upstreams. Their remaining quota is read from rate-limit
+    # response headers; once it falls to "reserve", refreshes that have a
+    # cached value to serve are deferred unless conditional (free when they
+    # 304) or for one of the host's "hot_keys" most requested keys. Exhausted
+    # quotas and Retry-After stop all requests to the host until reset.
+    RATE_LIMITS = {
+        "api.github.com": {"reserve": 3, "hot_keys": 3},
+        "api.themoviedb.org": {"reserve": 5, "hot_keys": 4},
+        "api.yelp.com": {"reserve": 200, "hot_keys": 5},
+        "app.ticketmaster.com": {"reserve": 200, "hot_keys": 5},
+    }
+
+    # Shared HTTP connection pool (keep-alive, per-host limits, optional HTTP/2)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"  # requires `h2`
+    HTTP_HOST_CONNECTION_LIMITS = {
+        "news.google.com": 20,
+        "api.github.com": 5,
+        "hnrss.org": 5,
+        "medium.com": 5,
+        "dev.to": 5,
+        "hashnode.com": 5,
+        "www.reddit.com": 5,
+    }
+
+    # Bulkheads: concurrent requests per upstream host ("limit") and how many
+    # more may wait for a slot ("queue"), for up to BULKHEAD_QUEUE_TIMEOUT
+    # seconds, before being rejected. A slow host only ties up its own slots,
+    # never the workers serving endpoints backed by other hosts.
+    BULKHEAD_DEFAULT = {"limit": 8, "queue": 16}
+    BULKHEAD_QUEUE_TIMEOUT = float(os.getenv("BULKHEAD_QUEUE_TIMEOUT", "1.0"))
+    BULKHEAD_LIMITS = {
+        "news.google.com": {"limit": 10, "queue": 20},
+        "app.ticketmaster.com": {"limit": 3, "queue": 3},
+        "api.yelp.com": {"limit": 3, "queue": 3},
+        "www.youtube.com": {"limit": 2, "queue": 2},
+        "openlibrary.org": {"limit": 4, "queue": 8},
+        "api.github.com": {"limit": 4, "queue": 4},
+    }
+
+    # Sync fetches made under a deadline run on their own pool of this many
+    # threads, apart from stale-while-revalidate refreshes, so they start at
+    # once and can finish in the background after the caller gives up. When
+    # every thread is busy, callers wait for one only as long as their deadline.
+    DEADLINE_FETCH_WORKERS = int(os.getenv("DEADLINE_FETCH_WORKERS", "16"))
+
+    # Upstream response size budgets (decoded bytes). Bodies are streamed and
+    # the download is aborted once it exceeds its host's budget, or cut off at
+    # the budget for hosts in RESPONSE_TRUNCATE_HOSTS whose prefix is enough.
+    RESPONSE_MAX_BYTES = int(os.getenv("RESPONSE_MAX_BYTES", str(2 * 1024 * 1024)))
+    RESPONSE_SIZE_LIMITS = {
+        "news.google.com": 1024 * 1024,
+        "hnrss.org": 512 * 1024,
+        "medium.com": 1024 * 1024,
+        "dev.to": 1024 * 1024,
+        "hashnode.com": 1024 * 1024,
+        "www.reddit.com": 1024 * 1024,
+        "wttr.in": 256 * 1024,
+        "api.quotable.io": 64 * 1024,
+        "www.youtube.com": 512 * 1024,
+    }
+    RESPONSE_TRUNCATE_HOSTS = {"www.youtube.com"}
+
+    # In-memory cache budget for upstream responses and its expiry sweep interval
+    CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CACHE_SWEEP_INTERVAL = float(os.getenv("CACHE_SWEEP_INTERVAL", "30"))
+    CACHE_LOCK_STRIPES = int(os.getenv("CACHE_LOCK_STRIPES", "16"))
+    # Entries unread for this many seconds are kept compressed (zstd/zlib) by the sweeper; 0 disables
+    CACHE_COMPRESS_AFTER = float(os.getenv("CACHE_COMPRESS_AFTER", "120"))
+    CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "4096"))
+
+    # Persistent SQLite cache tier shared by all workers; OFFLINE serves cached data without upstream calls
+    CACHE_DISK_ENABLED = os.getenv("CACHE_DISK_ENABLED", "true").lower() == "true"
+    CACHE_DISK_PATH = os.getenv(
+        "CACHE_DISK_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "upstream.sqlite3")
+    )
+    CACHE_DISK_MAX_AGE = int(os.getenv("CACHE_DISK_MAX_AGE", str(7 * 24 * 3600)))
+    CACHE_OFFLINE = os.getenv("CACHE_OFFLINE", "false").lower() == "true"
+
+    # Items parsed and cached per RSS/Atom feed (tools show the first 10)
+    FEED_ITEM_LIMIT = int(os.getenv("FEED_ITEM_LIMIT", "25"))
+
+    # Cache TTL policy. Rules are checked in order and the first match wins;
+    # each matches on "source" (tool name passed to fetch_*), "host", or "url"
+    # (regex searched in the URL). "ttl" is how long an entry stays fresh and
+    # "stale" how much longer it may be served while revalidating (0 disables).
+    # "negative" is how long a failed fetch or an empty result is remembered,
+    # so a broken upstream isn't retried on every request.
+    # TTLs get +/- CACHE_TTL_JITTER so entries don't expire in lockstep.
+    CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "300"))
+    CACHE_DEFAULT_STALE_WINDOW = int(os.getenv("CACHE_DEFAULT_STALE_WINDOW", "1800"))
+    CACHE_NEGATIVE_TTL = int(os.getenv("CACHE_NEGATIVE_TTL", "60"))
+    # Query params holding credentials; they are hashed rather than spelled out in cache keys
+    CACHE_KEY_SECRET_PARAMS = {"api_key", "apikey", "appid", "key", "token", "access_token"}
+    CACHE_TTL_JITTER = float(os.getenv("CACHE_TTL_JITTER", "0.1"))
+    CACHE_TTL_POLICY = [
+        {"source": "get_quote_of_day", "ttl": 24 * 3600, "stale": 24 * 3600},
+        {"source": "get_github_trending", "ttl": 3600, "stale": 6 * 3600},
+        {"source": "get_trending_books", "ttl": 3600, "stale": 6 * 3600},
+        {"source": "get_trending_movies", "ttl": 3600, "stale": 6 * 3600},
+        {"source": "get_trending_shows", "ttl": 3600, "stale": 6 * 3600},
+        {"source": "get_now_playing_movies", "ttl": 6 * 3600, "stale": 24 * 3600},
+        {"source": "search_movies", "ttl": 3600, "stale": 6 * 3600},
+        {"source": "get_best_food", "ttl": 3600, "stale": 6 * 3600},
+        {"source": "get_events_nearby", "ttl": 1800, "stale": 3600},
+        {"source": "get_local_weather", "ttl": 600, "stale": 1800},
+        {"host": "api.quotable.io", "ttl": 24 * 3600, "stale": 24 * 3600},
+        {"host": "api.github.com", "ttl": 3600, "stale": 6 * 3600},
+        {"url": r"news\.google\.com/rss/search", "ttl": 600, "stale": 3600},
+        {"host": "news.google.com", "ttl": 300, "stale": 3600},
+        {"host": "www.reddit.com", "ttl": 600, "stale": 900},
+        {"host": "hnrss.org", "ttl": 300, "stale": 900},
+        {"host": "medium.com", "ttl": 900, "stale": 3600},
+        {"host": "dev.to", "ttl": 900, "stale": 3600},
+        {"host": "hashnode.com", "ttl": 900, "stale": 3600, "negative": 300},
+        {"host": "wttr.in", "ttl": 600, "stale": 1800},
+        {"host": "www.youtube.com", "ttl": 1800, "stale": 3600},
+        {"host": "openlibrary.org", "ttl": 3600, "stale": 6 * 3600},
+    ]
     
     @staticmethod
     def get_config() -> Dict[str, Any]:
@@ -0,0 +1,168 @@
+"""Home-page dashboard: the data of every home section from one request.
+
+Sections run concurrently, each under its own latency budget. Within the
+budget the fetch layer serves cached or default data once upstreams are too
+slow (see tools.deadline); a section that still doesn't finish in time, or
+that raises, is reported as failed without failing the other sections.
+The dashboard is served whole (build_dashboard) or streamed section by
+section as each finishes (stream_dashboard).
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import urllib.parse
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from tools.deadline import deadline
+from tools.entertainment_tools import get_best_food, get_quote_of_day, get_trending_books, get_trending_fashion
+from tools.events_tools import get_events_nearby
+from tools.news_tools import get_medium_trending
+from tools.tech_tools import get_github_trending, get_tech_news
+from tools.utility_tools import get_cheapest_gas, get_store_products
+from tools.utils import afetch_json
+
+# Latency budget (seconds) per section; sections not listed get the default.
+DASHBOARD_DEFAULT_TIMEOUT = 1.0
+DASHBOARD_SECTION_TIMEOUTS = {
+    "weather": 0.5,
+    "quote": 0.3,
+    "books": 0.5,
+    "events": 1.5,
+    "food": 1.5,
+}
+# Extra time past a section's budget for its tool to return the fallback the fetch layer gave it
+DASHBOARD_GRACE = 0.1
+
+WEATHER_DEFAULT = {
+    "condition": "Partly Cloudy",
+    "temp_c": "20",
+    "temp_f": "68",
+    "feels_like_c": "19",
+    "feels_like_f": "66",
+    "humidity": "65"
+}
+
+
+async def current_weather(location: Optional[str] = None) -> Dict[str, str]:
+    """Current conditions from wttr.in (for location, else the caller's IP), or WEATHER_DEFAULT."""
+    url = f"https://wttr.in/{urllib.parse.quote(location)}?format=j1" if location else "https://wttr.in/?format=j1"
+    try:
+        # Cached (in memory and on disk) by the shared fetch layer
+        data = await afetch_json(url)
+        current = data.get("current_condition", [{}])[0]
+        return {
+            "condition": current.get("weatherDesc", [{}])[0].get("value", "Unknown"),
+            "temp_c": current.get("temp_C", "0"),
+            "temp_f": current.get("temp_F", "0"),
+            "feels_like_c": current.get("FeelsLikeC", "0"),
+            "feels_like_f": current.get("FeelsLikeF", "0"),
+            "humidity": current.get("humidity", "0")
+        }
+    except Exception:
+        return dict(WEATHER_DEFAULT)
+
+
+# Section name -> coroutine producing its data, as the section's own endpoint returns it
+DASHBOARD_SECTIONS: Dict[str, Callable[[], Awaitable[Any]]] = {
+    "weather": current_weather,
+    "news": lambda: get_tech_news.ainvoke({}),
+    "quote": lambda: get_quote_of_day.ainvoke({}),
+    "books": lambda: get_trending_books.ainvoke({}),
+    "articles": lambda: get_medium_trending.ainvoke({}),
+    "github": lambda: get_github_trending.ainvoke({}),
+    "fashion": lambda: get_trending_fashion.ainvoke({}),
+    "shopping": lambda: get_store_products.ainvoke({"store": None, "category": None}),
+    "gas": lambda: get_cheapest_gas.ainvoke({"zipcode": None}),
+    "food": lambda: get_best_food.ainvoke({"cuisine": None}),
+    "events": lambda: get_events_nearby.ainvoke(
+        {"location": "New York, NY", "radius": 25, "unit": "miles", "category": "music"}
+    ),
+}
+
+
+def encode_section(data: Any) -> Tuple[str, str]:
+    """A section's data as canonical JSON, and its version: a digest of that JSON.
+
+    The push channel (push.py) reports the same version as an update's
+    "digest", so a client that loaded the dashboard can subscribe "since" it.
+    """
+    encoded = json.dumps(data, sort_keys=True, default=str)
+    return encoded, hashlib.blake2b(encoded.encode(), digest_size=8).hexdigest()
+
+
+async def run_section(name: str) -> Dict[str, Any]:
+    """Run one section under its budget: {"name", "ok", "data", "ms"} plus "error" if it failed."""
+    budget = DASHBOARD_SECTION_TIMEOUTS.get(name, DASHBOARD_DEFAULT_TIMEOUT)
+    began = time.perf_counter()
+    result = {"name": name, "ok": True, "data": None}
+    try:
+        with deadline(budget):
+            result["data"] = await asyncio.wait_for(DASHBOARD_SECTIONS[name](), budget + DASHBOARD_GRACE)
+    except asyncio.TimeoutError:
+        result.update(ok=False, error=f"timed out after {budget}s")
+    except Exception as e:
+        result.update(ok=False, error=str(e) or type(e).__name__)
+    result["ms"] = round((time.perf_counter() - began) * 1000, 1)
+    return result
+
+
+async def build_dashboard() -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """All sections, fetched concurrently, and their timings in ms (plus "total").
+
+    Failed sections have null data and an entry in "errors"; the others
+    have their version (see encode_section) in "versions". Timings are
+    kept out of the document so that unchanged data keeps the same ETag.
+    """
+    began = time.perf_counter()
+    results = await asyncio.gather(*(run_section(name) for name in DASHBOARD_SECTIONS))
+    document = {
+        "success": True,
+        "data": {result["name"]: result["data"] for result in results},
+        "errors": {result["name"]: result["error"] for result in results if not result["ok"]},
+        "versions": {result["name"]: encode_section(result["data"])[1] for result in results if result["ok"]},
+    }
+    timings = {result["name"]: result["ms"] for result in results}
+    timings["total"] = round((time.perf_counter() - began) * 1000, 1)
+    return document, timings
+
+
+async def iter_dashboard() -> AsyncIterator[Dict[str, Any]]:
+    """Section results in completion order, then a summary of the run.
+
+    Results are {"type": "section", ...run_section's keys}; the summary is
+    {"type": "summary", "order", "errors", "timings_ms", "total_ms"}.
+    Sections still running when the consumer stops iterating are cancelled.
+    """
+    began = time.perf_counter()
+    tasks = [asyncio.ensure_future(run_section(name)) for name in DASHBOARD_SECTIONS]
+    order, errors, timings = [], {}, {}
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            order.append(result["name"])
+            timings[result["name"]] = result["ms"]
+            if not result["ok"]:
+                errors[result["name"]] = result["error"]
+            yield {"type": "section", **result}
+    finally:
+        for task in tasks:
+            task.cancel()
+    yield {
+        "type": "summary",
+        "order": order,
+        "errors": errors,
+        "timings_ms": timings,
+        "total_ms": round((time.perf_counter() - began) * 1000, 1),
+    }
+
+
+async def stream_dashboard(fmt: str = "sse") -> AsyncIterator[str]:
+    """iter_dashboard encoded as Server-Sent Events (event: section / summary) or NDJSON lines."""
+    async for event in iter_dashboard():
+        payload = json.dumps(event, default=str)
+        if fmt == "ndjson":
+            yield payload + "\n"
+        else:
+            yield f"event: {event['type']}\ndata: {payload}\n\n"
@@ -0,0 +1,131 @@
+"""Conditional GET for API responses: strong ETags, Last-Modified, 304s and Cache-Control.
+
+The ETag is a hash of the response body. Each URL also remembers which
+upstream cache entries its last response was built from, and the version
+(body digest) of each. Take a request whose If-None-Match (or
+If-Modified-Since) matches that response. If every one of those entries
+is still fresh and at the same version, the request is answered 304
+without running the endpoint. Otherwise the endpoint runs. If its body is
+unchanged the response is still a 304, which at least saves the transfer.
+
+Only responses built entirely from fresh upstream cache entries get the
+route's Cache-Control. Anything else may be fallback data: a default
+served because an upstream failed or a deadline passed, or a stale or
+expired entry. Those responses get "no-cache", so browsers and CDNs
+revalidate them and pick up real data once the upstream recovers.
+"""
+
+import email.utils
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from tools import metrics
+from tools.utils import cache_versions, track_cache_keys
+
+
+class _Validator:
+    __slots__ = ("etag", "last_modified", "versions")
+
+    def __init__(self, etag: str, last_modified: float, versions: Optional[Dict[str, str]]):
+        self.etag = etag
+        self.last_modified = last_modified
+        # Upstream cache key -> digest the response was built from; None if it can't be checked
+        self.versions = versions
+
+
+class ResponseValidators:
+    """The last response's ETag, Last-Modified and upstream versions per URL, LRU-bounded."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Validator]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[_Validator]:
+        validator = self._entries.get(key)
+        if validator is not None:
+            self._entries.move_to_end(key)
+        return validator
+
+    def remember(self, key: str, etag: str, versions: Optional[Dict[str, str]]) -> _Validator:
+        previous = self._entries.get(key)
+        last_modified = previous.last_modified if previous is not None and previous.etag == etag else time.time()
+        validator = self._entries[key] = _Validator(etag, last_modified, versions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return validator
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified) <= since
+
+
+def _is_current(request: Request, validator: Optional[_Validator]) -> bool:
+    """Whether the client's validators match the last response (If-None-Match wins over If-Modified-Since)."""
+    if validator is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validator.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    return if_modified_since is not None and _not_modified_since(if_modified_since, validator.last_modified)
+
+
+def _validator_headers(validator: _Validator, cache_control: str) -> Dict[str, str]:
+    return {
+        "ETag": validator.etag,
+        "Last-Modified": email.utils.formatdate(validator.last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+
+NOT_FRESH_CACHE_CONTROL = "no-cache"
+
+
+def _cache_key(request: Request) -> str:
+    query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    return f"{request.url.path}?{query}" if query else request.url.path
+
+
+async def conditional_get(request: Request, call_next, cache_control: str,
+                          validators: ResponseValidators) -> Response:
+    """Serve a GET through validators: 304 when the client's copy is current, else the tagged response."""
+    key = _cache_key(request)
+    validator = validators.get(key)
+    if (_is_current(request, validator) and validator.versions is not None
+            and cache_versions(validator.versions) == validator.versions):
+        metrics.increment("http.not_modified.cached")
+        return Response(status_code=304, headers=_validator_headers(validator, cache_control))
+
+    with track_cache_keys() as keys:
+        response = await call_next(request)
+    if response.status_code != 200 or response.headers.get("content-type", "").startswith("text/event-stream"):
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    validator = validators.remember(key, etag, cache_versions(keys) if keys else None)
+    if validator.versions is None:
+        # Not (only) fresh upstream data: possibly a fallback, so don't let caches keep it
+        metrics.increment("http.not_fresh")
+        cache_control = NOT_FRESH_CACHE_CONTROL
+    headers = {**response.headers, **_validator_headers(validator, cache_control)}
+    if _is_current(request, validator):
+        metrics.increment("http.not_modified.rendered")
+        headers.pop("content-length", None)
+        headers.pop("content-type", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, status_code=200, headers=headers)
@@ -0,0 +1,204 @@
+"""Response encoding for the API: fast JSON serialization and negotiated compression.
+
+FastJSONResponse renders with orjson when it's installed, and falls back to
+compact stdlib json otherwise. FastJSONRoute makes endpoints that return a
+plain dict or list go straight to FastJSONResponse, skipping FastAPI's
+jsonable_encoder pass. CompressionMiddleware compresses complete responses
+above a size threshold with brotli (if installed) or gzip, whichever the
+client's Accept-Encoding prefers. Streamed responses pass through as they are.
+"""
+
+import functools
+import gzip
+import inspect
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "application/xml", "application/javascript", "text/")
+
+
+def _default(obj: Any) -> Any:
+    """Encode what orjson / json don't handle natively, much like jsonable_encoder would."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class FastJSONRoute(APIRoute):
+    """APIRoute that returns dict/list results as FastJSONResponse, bypassing jsonable_encoder.
+
+    Only routes without a response model or return annotation are affected;
+    their results were encoded as-is anyway. Returned Responses pass through.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        response_model = kwargs.get("response_model")
+        no_model = (response_model is None or getattr(response_model, "value", object()) is None) \
+            and "return" not in getattr(endpoint, "__annotations__", {})
+        if no_model and inspect.iscoroutinefunction(endpoint):
+            endpoint = _direct_json(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _direct_json(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, (dict, list)):
+            return FastJSONResponse(result)
+        return result
+
+    return wrapper
+
+
+def _accepted_encodings(accept_encoding: str) -> List[Tuple[float, str]]:
+    accepted = []
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.append((q, name.strip().lower()))
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """The supported encoding the client prefers ("br" over "gzip" on a tie), or None."""
+    supported = {"gzip": 1} if brotli is None else {"br": 2, "gzip": 1}
+    best = None
+    for q, name in _accepted_encodings(accept_encoding):
+        if name == "*":
+            name = "br" if brotli is not None else "gzip"
+        if name in supported and (best is None or (q, supported[name]) > best[0]):
+            best = ((q, supported[name]), name)
+    return best[1] if best else None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+def _tag_suffix(encoding: str) -> str:
+    return f"-{encoding}"
+
+
+def _strip_tag_suffixes(if_none_match: str) -> Tuple[str, Optional[str]]:
+    """If-None-Match with encoding suffixes removed from its tags, and the suffix found, if any."""
+    found = None
+    tags = []
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        for encoding in ("br", "gzip"):
+            suffix = _tag_suffix(encoding) + '"'
+            if tag.endswith(suffix):
+                tag = tag[:-len(suffix)] + '"'
+                found = _tag_suffix(encoding)
+        tags.append(tag)
+    return ", ".join(tags), found
+
+
+class CompressionMiddleware:
+    """Compress complete responses of at least minimum_size bytes per the request's Accept-Encoding.
+
+    A compressed response gets Content-Encoding and Vary: Accept-Encoding.
+    Its ETag gets an encoding suffix (e.g. "abc-gzip"), because a strong
+    ETag belongs to one representation. The suffix is removed from
+    If-None-Match before the request reaches the app, so conditional
+    requests still match the app's validators.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        matched_suffix = None
+        if "if-none-match" in headers:
+            if_none_match, matched_suffix = _strip_tag_suffixes(headers["if-none-match"])
+            scope = dict(scope)
+            scope["headers"] = [(k, v) for k, v in scope["headers"] if k != b"if-none-match"]
+            scope["headers"].append((b"if-none-match", if_none_match.encode("latin-1")))
+
+        start: Optional[Message] = None
+
+        async def send_compressed(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            held, start = start, None
+            response_headers = MutableHeaders(raw=held["headers"])
+            body = message.get("body", b"")
+            if held["status"] == 304:
+                if matched_suffix and "etag" in response_headers:
+                    response_headers["ETag"] = response_headers["etag"][:-1] + matched_suffix + '"'
+            elif self._should_compress(response_headers, body, message.get("more_body", False)):
+                body = compress(body, encoding, self.gzip_level, self.brotli_quality)
+                response_headers["Content-Encoding"] = encoding
+                response_headers["Content-Length"] = str(len(body))
+                response_headers.add_vary_header("Accept-Encoding")
+                if "etag" in response_headers and response_headers["etag"].endswith('"'):
+                    response_headers["ETag"] = response_headers["etag"][:-1] + _tag_suffix(encoding) + '"'
+                message = {**message, "body": body}
+            await send({**held, "headers": response_headers.raw})
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    def _should_compress(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if more_body or "content-encoding" in headers or len(body) < self.minimum_size:
+            return False
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
@@ -0,0 +1,278 @@
+"""WebSocket push channel: clients subscribe to topics and hear about them only when they change.
+
+Topics are the home dashboard sections ("weather", "news", "quote", ...)
+and parameterized feeds:
+
+  news:<TOPIC>         Google News for a topic (WORLD, TECHNOLOGY, ...)
+  devto:<tag>          Dev.to stories for a tag
+  weather:<location>   current weather for a location
+
+Protocol, in JSON text frames:
+
+  client -> {"action": "subscribe", "topics": [...], "since": {topic: digest}}
+  client -> {"action": "unsubscribe", "topics": [...]}
+  server -> {"type": "update", "topic", "digest", "data"}
+  server -> {"type": "subscribed" | "unsubscribed", "topics": [...]}
+  server -> {"type": "error", "error"}
+
+A new subscriber gets the topic's current data unless "since" carries the
+digest it already has (for dashboard sections, the "versions" of the
+/api/dashboard response). After that it only hears about the topic when
+the topic's data changes.
+
+State is kept per topic rather than per connection. A topic keeps its
+latest update (encoded once, then sent to every subscriber), its digest,
+its subscribers, and the cache keys its data was built from. A connection
+holds only its socket and topic names, so idle subscribers cost little. A
+topic is rebuilt when the fetch layer caches a new value for one of its
+keys. It is also re-read every PUSH_POLL_INTERVAL, which makes stale
+entries revalidate.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from dashboard import DASHBOARD_SECTIONS, current_weather, encode_section
+from tools.news_tools import get_devto_trending, get_google_news
+from tools.utils import add_change_listener, remove_change_listener, track_cache_keys
+
+PUSH_POLL_INTERVAL = 30.0
+# Longest a topic rebuild may take; rebuilds run off the request path, so they wait for real data
+PUSH_REFRESH_TIMEOUT = 15.0
+# A subscriber that can't take a message within this long is disconnected
+PUSH_SEND_TIMEOUT = 5.0
+PUSH_MAX_TOPICS_PER_CONNECTION = 20
+PUSH_MAX_PARAM_LENGTH = 64
+
+PARAM_TOPICS: Dict[str, Callable[[str], Awaitable[Any]]] = {
+    "news": lambda topic: get_google_news.ainvoke({"topic": topic.upper()}),
+    "devto": lambda tag: get_devto_trending.ainvoke({"tag": tag}),
+    "weather": current_weather,
+}
+
+
+def producer_for(topic: str) -> Optional[Callable[[], Awaitable[Any]]]:
+    """The coroutine function building a topic's data, or None for an unknown topic."""
+    if topic in DASHBOARD_SECTIONS:
+        return DASHBOARD_SECTIONS[topic]
+    kind, sep, param = topic.partition(":")
+    if sep and kind in PARAM_TOPICS and 0 < len(param) <= PUSH_MAX_PARAM_LENGTH:
+        return lambda: PARAM_TOPICS[kind](param)
+    return None
+
+
+class Topic:
+    __slots__ = ("name", "produce", "subscribers", "digest", "message", "keys", "refreshing", "dirty")
+
+    def __init__(self, name: str, produce: Callable[[], Awaitable[Any]]):
+        self.name = name
+        self.produce = produce
+        self.subscribers: Set["Connection"] = set()
+        self.digest: Optional[str] = None
+        self.message: Optional[str] = None
+        self.keys: Set[str] = set()
+        self.refreshing = False
+        self.dirty = False
+
+
+class Connection:
+    __slots__ = ("websocket", "topics", "held", "closed")
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.topics: Set[str] = set()
+        # Topic -> digest the client said it has, until its first update is due
+        self.held: Dict[str, str] = {}
+        self.closed = False
+
+
+class PushHub:
+    """Topic registry, change-driven rebuilds and fan-out to WebSocket subscribers."""
+
+    def __init__(self):
+        self.topics: Dict[str, Topic] = {}
+        self._by_key: Dict[str, Set[str]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poller: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        add_change_listener(self._on_change)
+        self._poller = asyncio.ensure_future(self._poll())
+
+    async def stop(self):
+        remove_change_listener(self._on_change)
+        for task in [self._poller, *self._tasks]:
+            if task is not None:
+                task.cancel()
+        self._poller = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "topics": len(self.topics),
+            "subscriptions": sum(len(topic.subscribers) for topic in self.topics.values()),
+            "tracked_keys": len(self._by_key),
+        }
+
+    async def serve(self, websocket: WebSocket):
+        """Run one client connection until it disconnects."""
+        await websocket.accept()
+        conn = Connection(websocket)
+        try:
+            while not conn.closed:
+                try:
+                    request = json.loads(await websocket.receive_text())
+                    action, topics = request["action"], request["topics"]
+                    if not isinstance(topics, list):
+                        raise TypeError("topics must be a list")
+                    since = request.get("since") or {}
+                    if not isinstance(since, dict) or not all(
+                            isinstance(name, str) and isinstance(digest, str) for name, digest in since.items()):
+                        raise TypeError("since must map topic names to digests")
+                except (ValueError, KeyError, TypeError) as e:
+                    await websocket.send_text(json.dumps({"type": "error", "error": f"bad request: {e}"}))
+                    continue
+                if action == "subscribe":
+                    await self._subscribe(conn, topics, since)
+                elif action == "unsubscribe":
+                    self._unsubscribe(conn, topics)
+                    await websocket.send_text(json.dumps({"type": "unsubscribed", "topics": topics}))
+                else:
+                    await websocket.send_text(json.dumps({"type": "error", "error": f"unknown action {action!r}"}))
+        except (WebSocketDisconnect, RuntimeError):
+            # RuntimeError: the socket was already closed, e.g. by _send dropping a slow subscriber
+            pass
+        finally:
+            self._unsubscribe(conn, list(conn.topics))
+
+    async def _subscribe(self, conn: Connection, names: Iterable[str], since: Dict[str, str]):
+        accepted, rejected = [], []
+        for name in names:
+            produce = producer_for(name) if isinstance(name, str) else None
+            if produce is None or (name not in conn.topics and len(conn.topics) >= PUSH_MAX_TOPICS_PER_CONNECTION):
+                rejected.append(name)
+                continue
+            topic = self.topics.get(name)
+            if topic is None:
+                topic = self.topics[name] = Topic(name, produce)
+            topic.subscribers.add(conn)
+            conn.topics.add(name)
+            if name in since:
+                conn.held[name] = since[name]
+            accepted.append(name)
+        reply = {"type": "subscribed", "topics": accepted}
+        if rejected:
+            reply["rejected"] = rejected
+        await conn.websocket.send_text(json.dumps(reply))
+        for name in accepted:
+            topic = self.topics[name]
+            if topic.message is None:
+                self._schedule(name)
+            elif conn.held.pop(name, None) != topic.digest:
+                await self._send(conn, topic.message)
+
+    def _unsubscribe(self, conn: Connection, names: Iterable[str]):
+        for name in names:
+            conn.topics.discard(name)
+            conn.held.pop(name, None)
+            topic = self.topics.get(name)
+            if topic is None:
+                continue
+            topic.subscribers.discard(conn)
+            if not topic.subscribers:
+                del self.topics[name]
+                self._index(name, topic.keys, set())
+
+    def _index(self, name: str, old: Set[str], new: Set[str]):
+        for key in old - new:
+            names = self._by_key.get(key)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._by_key[key]
+        for key in new - old:
+            self._by_key.setdefault(key, set()).add(name)
+
+    def _on_change(self, cache_key: str):
+        # Called by the fetch layer from any thread or loop
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._changed, cache_key)
+        except RuntimeError:
+            pass
+
+    def _changed(self, cache_key: str):
+        for name in list(self._by_key.get(cache_key, ())):
+            self._schedule(name)
+
+    def _schedule(self, name: str):
+        topic = self.topics.get(name)
+        if topic is None:
+            return
+        if topic.refreshing:
+            topic.dirty = True
+            return
+        topic.refreshing = True
+        task = asyncio.ensure_future(self._refresh(topic))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, topic: Topic):
+        """Rebuild a topic's data and push it to subscribers if its digest changed."""
+        try:
+            while True:
+                topic.dirty = False
+                with track_cache_keys() as keys:
+                    try:
+                        data = await asyncio.wait_for(topic.produce(), PUSH_REFRESH_TIMEOUT)
+                    except Exception as e:
+                        print(f"Push topic {topic.name} failed to refresh: {e}")
+                        data = None
+                if self.topics.get(topic.name) is not topic:
+                    return
+                self._index(topic.name, topic.keys, keys)
+                topic.keys = keys
+                if data is not None:
+                    encoded, digest = encode_section(data)
+                    if digest != topic.digest:
+                        topic.digest = digest
+                        topic.message = (f'{{"type": "update", "topic": {json.dumps(topic.name)}, '
+                                         f'"digest": "{digest}", "data": {encoded}}}')
+                        await self._broadcast(topic)
+                if not topic.dirty:
+                    return
+        finally:
+            topic.refreshing = False
+
+    async def _broadcast(self, topic: Topic):
+        # Subscribers that joined with this very digest already have the data
+        message = topic.message
+        recipients = [conn for conn in list(topic.subscribers) if conn.held.pop(topic.name, None) != topic.digest]
+        await asyncio.gather(*(self._send(conn, message) for conn in recipients))
+
+    async def _send(self, conn: Connection, message: str):
+        try:
+            await asyncio.wait_for(conn.websocket.send_text(message), PUSH_SEND_TIMEOUT)
+        except Exception:
+            # Gone or too slow to keep up: drop it rather than hold the topic's fan-out
+            conn.closed = True
+            self._unsubscribe(conn, list(conn.topics))
+            try:
+                await conn.websocket.close()
+            except Exception:
+                pass
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(PUSH_POLL_INTERVAL)
+            for name in list(self.topics):
+                self._schedule(name)
+
+
+push_hub = PushHub()
@@ -0,0 +1,52 @@
+"""Cache-Control of API responses built from fresh upstream data versus fallback data."""
+
+import os
+import tempfile
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from config import APIConfig
+
+APIConfig.CACHE_DISK_PATH = os.path.join(tempfile.mkdtemp(), "upstream.sqlite3")
+
+import app as app_module  # noqa: E402
+from tools import utils  # noqa: E402
+
+
+def _client_for(handler):
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def _async_client_for(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Route every upstream request through the handler set on the returned dict."""
+    state = {"handler": lambda request: httpx.Response(503)}
+    monkeypatch.setattr(utils, "get_client", lambda: _client_for(lambda r: state["handler"](r)))
+    monkeypatch.setattr(utils, "get_async_client", lambda: _async_client_for(lambda r: state["handler"](r)))
+    monkeypatch.setattr(APIConfig, "CACHE_DISK_ENABLED", False)
+    utils._cache.clear()
+    yield state
+    utils._cache.clear()
+
+
+def test_cold_cache_fallback_is_not_cached(upstream):
+    client = TestClient(app_module.app)
+    response = client.get("/api/quotes/daily")
+    assert response.status_code == 200
+    assert response.json()["success"]
+    assert response.headers["cache-control"] == "no-cache"
+    assert "etag" in response.headers
+
+
+def test_fresh_upstream_data_gets_route_max_age(upstream):
+    upstream["handler"] = lambda request: httpx.Response(200, json={"content": "Stay curious.", "author": "Someone"})
+    client = TestClient(app_module.app)
+    response = client.get("/api/quotes/daily")
+    assert response.json()["data"]["text"] == "Stay curious."
+    assert response.headers["cache-control"].startswith("public, max-age=3600")
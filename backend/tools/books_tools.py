@@ -1,6 +1,5 @@
 """Books tools for fetching trending books."""
 
-import requests
 import sys
 from pathlib import Path
 from langchain.tools import tool
@@ -8,6 +7,7 @@ from langchain.tools import tool
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import APIConfig
+from .utils import fetch_json
 
 
 @tool
@@ -29,9 +29,7 @@ def get_trending_books(query: str = "trending"):
             "sort": "-key"
         }
         
-        response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
+        data = fetch_json(url, params=params, source="get_trending_books")
         
         books = []
         for doc in data.get("docs", [])[:10]:
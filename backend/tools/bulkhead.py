@@ -0,0 +1,158 @@
+"""Per-upstream-host concurrency limits so a slow upstream can't take every worker.
+
+Each host gets a Bulkhead (limits from APIConfig.BULKHEAD_LIMITS): at most
+``limit`` requests to it run at once, up to ``queue`` more wait for a slot,
+and anything beyond that, or waiting longer than the queue timeout, is
+rejected with BulkheadFull. A host that hangs therefore ties up only its own
+slots and queue, and endpoints backed by other hosts keep their threads and
+connections. Sync (thread) and async callers share a host's slots.
+"""
+
+import asyncio
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict
+
+import httpx
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+
+class BulkheadFull(httpx.HTTPError):
+    """Too many requests to the upstream are running or queued; the request was not sent."""
+
+
+class Bulkhead:
+    """FIFO counting semaphore for one upstream host, usable from threads and coroutines.
+
+    A released slot is handed straight to the oldest waiter, a
+    threading.Event for threads or an asyncio future for coroutines,
+    which is resolved on its own event loop.
+    """
+
+    def __init__(self, host: str, limit: int, queue: int):
+        self.host = host
+        self.limit = limit
+        self.queue = queue
+        self.active = 0
+        self.peak_waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.gave_up = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def _enter_or_wait(self, waiter) -> bool:
+        """Take a free slot (True) or queue waiter (False); raise BulkheadFull if the queue is full."""
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                self.admitted += 1
+                return True
+            if len(self._waiters) >= self.queue:
+                self.rejected += 1
+                raise BulkheadFull(f"{self.host}: {self.active} requests running, {len(self._waiters)} queued")
+            self._waiters.append(waiter)
+            self.queued += 1
+            self.peak_waiting = max(self.peak_waiting, len(self._waiters))
+            return False
+
+    def _give_up(self, waiter) -> bool:
+        """Dequeue a waiter that stopped waiting; False if a slot was already handed to it."""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                return False
+            self.gave_up += 1
+            return True
+
+    def acquire(self, timeout: float):
+        """Block the calling thread until a slot is free, for at most timeout seconds."""
+        event = threading.Event()
+        if self._enter_or_wait(event):
+            return
+        if not event.wait(timeout) and self._give_up(event):
+            raise BulkheadFull(f"{self.host}: no free slot within {timeout:.2f}s")
+
+    async def aacquire(self, timeout: float):
+        """Async counterpart of acquire; the coroutine waits without holding a thread."""
+        future = asyncio.get_running_loop().create_future()
+        waiter = (asyncio.get_running_loop(), future)
+        if self._enter_or_wait(waiter):
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            # Unless the slot arrived just as the wait timed out; then keep it
+            if self._give_up(waiter) or future.cancel():
+                raise BulkheadFull(f"{self.host}: no free slot within {timeout:.2f}s") from None
+        except BaseException:
+            # Cancelled: a slot already handed to us is passed on (by _hand_over if still in transit)
+            if not self._give_up(waiter) and not future.cancel():
+                self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                self.admitted += 1
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                loop, future = waiter
+                try:
+                    loop.call_soon_threadsafe(self._hand_over, future)
+                    return
+                except RuntimeError:  # its loop is closed
+                    self.admitted -= 1
+            self.active -= 1
+
+    def _hand_over(self, future: asyncio.Future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "active": self.active,
+                "waiting": len(self._waiters),
+                "peak_waiting": self.peak_waiting,
+                "admitted": self.admitted,
+                "queued": self.queued,
+                "rejected": self.rejected,
+                "gave_up": self.gave_up,
+            }
+
+
+_bulkheads: Dict[str, Bulkhead] = {}
+_registry_lock = threading.Lock()
+
+
+def bulkhead_for(host: str) -> Bulkhead:
+    """Return the bulkhead for an upstream host, creating it on first use."""
+    bulkhead = _bulkheads.get(host)
+    if bulkhead is None:
+        with _registry_lock:
+            bulkhead = _bulkheads.get(host)
+            if bulkhead is None:
+                settings = APIConfig.BULKHEAD_LIMITS.get(host, APIConfig.BULKHEAD_DEFAULT)
+                bulkhead = Bulkhead(host, settings["limit"], settings["queue"])
+                _bulkheads[host] = bulkhead
+    return bulkhead
+
+
+def bulkhead_stats() -> Dict[str, Dict[str, Any]]:
+    """Running, queued and rejected request counts of every upstream seen so far."""
+    with _registry_lock:
+        bulkheads = sorted(_bulkheads.items())
+    return {host: bulkhead.stats() for host, bulkhead in bulkheads}
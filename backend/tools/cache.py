@@ -0,0 +1,343 @@
+"""Bounded, size-aware TTL cache backing the fetch helpers in utils."""
+
+import heapq
+import pickle
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional; cold entries fall back to zlib
+    zstandard = None
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate the memory held by a cached value, in bytes."""
+    size = sys.getsizeof(value)
+    if _depth > 8:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1)
+    return size
+
+
+def compress_value(value: Any) -> bytes:
+    """Serialize and compress a cached value (zstd when installed, zlib otherwise)."""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if zstandard is not None:
+        return b"z" + zstandard.compress(data, 3)
+    return b"d" + zlib.compress(data, 6)
+
+
+def decompress_value(blob: bytes) -> Any:
+    """Inverse of compress_value."""
+    codec, payload = blob[:1], blob[1:]
+    data = zstandard.decompress(payload) if codec == b"z" else zlib.decompress(payload)
+    return pickle.loads(data)
+
+
+class CacheEntry:
+    """A cached value with its soft (fresh) and hard (stale) expiry.
+
+    Entries are never mutated after creation (an overwrite stores a new one),
+    so callers may read them outside the cache's locks.
+    """
+
+    __slots__ = ("value", "size", "expires_at", "stale_until", "namespace", "validators", "digest",
+                 "compressed")
+
+    def __init__(self, value: Any, size: int, expires_at: float, stale_until: float, namespace: str,
+                 validators: Optional[Dict[str, str]] = None, digest: Optional[str] = None,
+                 compressed: bool = False):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.namespace = namespace
+        # HTTP validators (ETag / Last-Modified) and a hash of the raw body used to revalidate
+        self.validators = validators or {}
+        self.digest = digest
+        # Cold entries hold (compress_value() bytes, uncompressed size); TTLCache.get() never returns them
+        self.compressed = compressed
+
+    def with_value(self, value: Any, size: int, compressed: bool) -> "CacheEntry":
+        """A copy of this entry holding a different representation of the same value."""
+        return CacheEntry(value, size, self.expires_at, self.stale_until, self.namespace,
+                          self.validators, self.digest, compressed)
+
+
+class _CacheSegment:
+    """One lock-protected shard of a TTLCache with its own LRU order and byte budget."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.accessed: Dict[str, float] = {}
+        self.expiry_heap: List[Tuple[float, str]] = []
+        self.bytes = 0
+        self.namespaces: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+        self.expirations = 0
+        self.compressed_entries = 0
+        self.compressions = 0
+        self.decompressions = 0
+        self.decompress_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.accessed[key] = time.time()
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self.lock:
+            self._remove(key)
+            self.entries[key] = entry
+            self.accessed[key] = time.time()
+            self._account(entry, 1)
+            heapq.heappush(self.expiry_heap, (entry.stale_until, key))
+            self._evict_over_budget()
+            if len(self.expiry_heap) > 2 * len(self.entries) + 64:
+                self._rebuild_heap()
+
+    def replace(self, key: str, old: CacheEntry, new: CacheEntry) -> bool:
+        """Swap in another representation of an entry, unless it was overwritten meanwhile."""
+        with self.lock:
+            if self.entries.get(key) is not old:
+                return False
+            self._account(old, -1)
+            self.entries[key] = new
+            self._account(new, 1)
+            self._evict_over_budget()
+            return True
+
+    def idle_entries(self, cutoff: float, min_bytes: int) -> List[Tuple[str, CacheEntry]]:
+        """Uncompressed entries of at least min_bytes not read since cutoff, oldest first."""
+        idle = []
+        with self.lock:
+            # The LRU order is access order, so everything after the first recent key is recent too
+            for key, entry in self.entries.items():
+                if self.accessed.get(key, 0) > cutoff:
+                    break
+                if not entry.compressed and entry.size >= min_bytes:
+                    idle.append((key, entry))
+        return idle
+
+    def delete(self, key: str):
+        with self.lock:
+            self._remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.accessed.clear()
+            self.expiry_heap.clear()
+            self.namespaces.clear()
+            self.bytes = 0
+            self.compressed_entries = 0
+
+    def sweep(self, now: float) -> int:
+        removed = 0
+        with self.lock:
+            while self.expiry_heap and self.expiry_heap[0][0] <= now:
+                _, key = heapq.heappop(self.expiry_heap)
+                entry = self.entries.get(key)
+                # Heap items are not updated on overwrite; skip ones that no longer apply
+                if entry is not None and entry.stale_until <= now:
+                    self._remove(key)
+                    removed += 1
+            self.expirations += removed
+        return removed
+
+    def _evict_over_budget(self):
+        while self.bytes > self.max_bytes and self.entries:
+            evicted_key, evicted = self.entries.popitem(last=False)
+            self.accessed.pop(evicted_key, None)
+            self._account(evicted, -1)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self.entries.pop(key, None)
+        self.accessed.pop(key, None)
+        if entry is not None:
+            self._account(entry, -1)
+
+    def _account(self, entry: CacheEntry, sign: int):
+        self.bytes += sign * entry.size
+        if entry.compressed:
+            self.compressed_entries += sign
+        counts = self.namespaces.setdefault(entry.namespace, {"entries": 0, "bytes": 0})
+        counts["entries"] += sign
+        counts["bytes"] += sign * entry.size
+        if counts["entries"] <= 0:
+            del self.namespaces[entry.namespace]
+
+    def _rebuild_heap(self):
+        self.expiry_heap = [(entry.stale_until, key) for key, entry in self.entries.items()]
+        heapq.heapify(self.expiry_heap)
+
+
+class TTLCache:
+    """Thread-safe LRU cache with a byte budget and proactive expiry.
+
+    Keys are hashed onto ``stripes`` independent segments, each with its own
+    lock, LRU order and share of ``max_bytes``, so threads touching different
+    keys rarely contend. Within a segment entries are evicted
+    least-recently-used first once its budget is exceeded, and entries past
+    their hard expiry are removed by ``sweep()`` using a min-heap of expiry
+    times, so keys that are never read again still release their memory.
+    Memory is accounted per namespace (e.g. ``xml:news.google.com``) to show
+    which sources hold the most.
+
+    With ``compress_after`` set, ``compress_idle()`` stores entries of at
+    least ``compress_min_bytes`` that haven't been read for that many seconds
+    in compressed form. The next ``get()`` decompresses such an entry and
+    keeps it uncompressed again, since it is evidently being read.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: Optional[int] = None, stripes: int = 16,
+                 compress_after: float = 0, compress_min_bytes: int = 4096):
+        self.max_bytes = max_bytes
+        segment_bytes = max(1, max_bytes // stripes)
+        self.max_entry_bytes = min(max_entry_bytes or max_bytes // 4, segment_bytes)
+        self.compress_after = compress_after
+        self.compress_min_bytes = compress_min_bytes
+        self._segments = [_CacheSegment(segment_bytes) for _ in range(stripes)]
+
+    def _segment(self, key: str) -> _CacheSegment:
+        return self._segments[hash(key) % len(self._segments)]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key (whatever its freshness) and mark it recently used."""
+        segment = self._segment(key)
+        entry = segment.get(key)
+        if entry is not None and entry.compressed:
+            entry = self._inflate(segment, key, entry)
+        return entry
+
+    def _inflate(self, segment: _CacheSegment, key: str, entry: CacheEntry) -> CacheEntry:
+        began = time.perf_counter()
+        blob, size = entry.value
+        hot = entry.with_value(decompress_value(blob), size, compressed=False)
+        elapsed = time.perf_counter() - began
+        segment.replace(key, entry, hot)
+        with segment.lock:
+            segment.decompressions += 1
+            segment.decompress_seconds += elapsed
+        return hot
+
+    def set(self, key: str, value: Any, ttl: float, stale_window: float = 0, namespace: str = "default",
+            size: Optional[int] = None, validators: Optional[Dict[str, str]] = None,
+            digest: Optional[str] = None) -> Optional[CacheEntry]:
+        """Store value and return its entry, or None if it is too large to cache."""
+        size = size if size is not None else estimate_size(value)
+        if size > self.max_entry_bytes:
+            return None
+        expires_at = time.time() + ttl
+        entry = CacheEntry(value, size, expires_at, expires_at + stale_window, namespace, validators, digest)
+        self._segment(key).set(key, entry)
+        return entry
+
+    def delete(self, key: str):
+        self._segment(key).delete(key)
+
+    def clear(self):
+        for segment in self._segments:
+            segment.clear()
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop every entry past its hard expiry and return how many were removed."""
+        now = now if now is not None else time.time()
+        return sum(segment.sweep(now) for segment in self._segments)
+
+    def compress_idle(self, now: Optional[float] = None) -> int:
+        """Compress entries idle for compress_after seconds and return how many were compressed.
+
+        Compression runs outside the segment locks; an entry overwritten in
+        the meantime is left alone.
+        """
+        if not self.compress_after:
+            return 0
+        now = now if now is not None else time.time()
+        total = 0
+        for segment in self._segments:
+            compressed = 0
+            for key, entry in segment.idle_entries(now - self.compress_after, self.compress_min_bytes):
+                try:
+                    blob = compress_value(entry.value)
+                except Exception:
+                    continue
+                size = sys.getsizeof(blob)
+                if size >= entry.size:
+                    continue
+                if segment.replace(key, entry, entry.with_value((blob, entry.size), size, compressed=True)):
+                    compressed += 1
+            with segment.lock:
+                segment.compressions += compressed
+            total += compressed
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {"entries": 0, "bytes": 0, "max_bytes": self.max_bytes, "stripes": len(self._segments),
+                 "evictions": 0, "expirations": 0, "compressed_entries": 0, "compressions": 0,
+                 "decompressions": 0, "decompress_seconds": 0.0, "namespaces": {}}
+        for segment in self._segments:
+            with segment.lock:
+                stats["entries"] += len(segment.entries)
+                stats["bytes"] += segment.bytes
+                stats["evictions"] += segment.evictions
+                stats["expirations"] += segment.expirations
+                stats["compressed_entries"] += segment.compressed_entries
+                stats["compressions"] += segment.compressions
+                stats["decompressions"] += segment.decompressions
+                stats["decompress_seconds"] += segment.decompress_seconds
+                for ns, counts in segment.namespaces.items():
+                    total = stats["namespaces"].setdefault(ns, {"entries": 0, "bytes": 0})
+                    total["entries"] += counts["entries"]
+                    total["bytes"] += counts["bytes"]
+        return stats
+
+    def __len__(self) -> int:
+        return sum(len(segment.entries) for segment in self._segments)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._segment(key).entries
+
+
+class CacheSweeper:
+    """Daemon thread that periodically calls ``cache.sweep()`` and ``cache.compress_idle()``."""
+
+    def __init__(self, cache: TTLCache, interval: float):
+        self.cache = cache
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.cache.sweep()
+            self.cache.compress_idle()
@@ -0,0 +1,62 @@
+"""Declarative per-source cache TTLs (see APIConfig.CACHE_TTL_POLICY)."""
+
+import random
+import re
+import sys
+import urllib.parse
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+
+class CachePolicy:
+    """Freshness TTL, stale-while-revalidate window and negative TTL for one cached source."""
+
+    __slots__ = ("ttl", "stale_window", "negative_ttl")
+
+    def __init__(self, ttl: float, stale_window: float, negative_ttl: float):
+        self.ttl = ttl
+        self.stale_window = stale_window
+        # How long a failed fetch or an empty result is remembered before trying again
+        self.negative_ttl = negative_ttl
+
+    def jittered_ttl(self) -> float:
+        """TTL spread by +/- CACHE_TTL_JITTER so entries stored together expire apart."""
+        jitter = APIConfig.CACHE_TTL_JITTER
+        return self.ttl * random.uniform(1 - jitter, 1 + jitter) if jitter else self.ttl
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str):
+    return re.compile(pattern)
+
+
+def _matches(rule: dict, url: str, host: str, source: Optional[str]) -> bool:
+    if "source" in rule:
+        return rule["source"] == source
+    if "host" in rule:
+        return rule["host"] == host
+    if "url" in rule:
+        return _compile(rule["url"]).search(url) is not None
+    return False
+
+
+def policy_for(url: str, source: Optional[str] = None, ttl: Optional[float] = None) -> CachePolicy:
+    """Resolve the cache policy for a URL; an explicit ttl overrides the table's."""
+    host = urllib.parse.urlsplit(url).hostname or ""
+    for rule in APIConfig.CACHE_TTL_POLICY:
+        if _matches(rule, url, host, source):
+            policy = CachePolicy(rule.get("ttl", APIConfig.CACHE_DEFAULT_TTL),
+                                 rule.get("stale", APIConfig.CACHE_DEFAULT_STALE_WINDOW),
+                                 rule.get("negative", APIConfig.CACHE_NEGATIVE_TTL))
+            break
+    else:
+        policy = CachePolicy(APIConfig.CACHE_DEFAULT_TTL, APIConfig.CACHE_DEFAULT_STALE_WINDOW,
+                             APIConfig.CACHE_NEGATIVE_TTL)
+    if ttl is not None:
+        policy.ttl = ttl
+    return policy
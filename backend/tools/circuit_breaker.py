@@ -0,0 +1,134 @@
+"""Per-upstream-host circuit breakers so a dead upstream fails fast instead of timing out."""
+
+import math
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """The upstream's breaker is open; the request was not sent."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one upstream host.
+
+    After ``failure_threshold`` failures in a row the breaker opens and
+    ``allow()`` rejects calls for ``recovery_timeout`` seconds. It then lets a
+    single probe through (half-open): success closes it, failure re-opens it.
+    Latencies of recent successful responses are kept to report percentiles
+    (and to time hedges); failures and timeouts are left out so an outage
+    doesn't drag them up to the timeout.
+    """
+
+    def __init__(self, host: str, failure_threshold: int, recovery_timeout: float, window: int = 200):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=window)
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may be sent now; half-open admits one probe at a time."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, latency: Optional[float] = None):
+        """Count a call that didn't fail the upstream; latency is sampled when given."""
+        with self._lock:
+            if latency is not None:
+                self.latencies.append(latency)
+            self.total_successes += 1
+            self.failures = 0
+            self._probing = False
+            self.state = CLOSED
+
+    def record_failure(self) -> bool:
+        """Count a failed call; returns True if this failure opened the breaker."""
+        with self._lock:
+            self.total_failures += 1
+            self.failures += 1
+            self._probing = False
+            if self.state != OPEN and (self.state == HALF_OPEN or self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def release(self):
+        """Forget an admitted call that ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    def latency_percentile(self, q: float) -> Optional[float]:
+        """The q-th percentile (0-100) of recent call latencies in seconds, or None without data."""
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, max(0, math.ceil(q / 100 * len(samples)) - 1))]
+
+    def stats(self) -> Dict[str, Any]:
+        p50, p95 = self.latency_percentile(50), self.latency_percentile(95)
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "failures": self.total_failures,
+                "successes": self.total_successes,
+                "rejected": self.rejected,
+                "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    """Return the breaker for an upstream host, creating it on first use."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _registry_lock:
+            breaker = _breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, APIConfig.BREAKER_FAILURE_THRESHOLD,
+                                         APIConfig.BREAKER_RECOVERY_TIMEOUT)
+                _breakers[host] = breaker
+    return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """State, counters and latency percentiles of every upstream seen so far."""
+    with _registry_lock:
+        breakers = sorted(_breakers.items())
+    return {host: breaker.stats() for host, breaker in breakers}
@@ -0,0 +1,39 @@
+"""Request-scoped deadlines that bound how long the fetch layer waits on upstreams.
+
+A deadline is set around a unit of work (an API route, a tool call) and is
+carried in a context variable, so it reaches the fetch layer through any
+number of tool and helper calls, including ``ainvoke`` and threadpool hops.
+The fetch layer stops waiting once it passes, serves cached data or raises
+DeadlineExceeded, and lets the upstream fetch finish in the background.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("fetch_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The caller's latency budget ran out before the upstream answered."""
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Limit waits in the enclosed block to ``seconds``; nested deadlines never extend an outer one."""
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (never negative), or None without one."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return max(0.0, expires_at - time.monotonic())
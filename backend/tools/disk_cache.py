@@ -0,0 +1,84 @@
+"""Persistent SQLite tier for the fetch cache so restarts and deploys start warm."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .cache import CacheEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    validators TEXT,
+    digest TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class DiskCache:
+    """Key/value store of cache entries with their expiry and validators.
+
+    The database runs in WAL mode so several uvicorn workers can read it
+    concurrently while one of them writes. Each thread gets its own
+    connection, and values are stored as JSON.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry fields for key, or None."""
+        row = self._connect().execute(
+            "SELECT value, expires_at, stale_until, validators, digest FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at, stale_until, validators, digest = row
+        return {
+            "value": json.loads(value),
+            "expires_at": expires_at,
+            "stale_until": stale_until,
+            "validators": json.loads(validators) if validators else {},
+            "digest": digest,
+        }
+
+    def set(self, key: str, entry: CacheEntry):
+        """Write an entry; values that aren't JSON-serializable are skipped."""
+        try:
+            value = json.dumps(entry.value)
+        except (TypeError, ValueError):
+            return
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires_at, stale_until, validators, digest, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, value, entry.expires_at, entry.stale_until, json.dumps(entry.validators), entry.digest,
+             time.time()),
+        )
+
+    def purge(self, max_age: float) -> int:
+        """Delete entries not updated within max_age seconds; returns how many."""
+        cursor = self._connect().execute("DELETE FROM entries WHERE updated_at < ?", (time.time() - max_age,))
+        return cursor.rowcount
@@ -1,6 +1,5 @@
 """Entertainment and lifestyle tools with real API integration."""
 
-import requests
 import random
 import sys
 from pathlib import Path
@@ -10,6 +9,9 @@ from typing import Optional, Dict, Any
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import APIConfig
+from .utils import afetch_json, async_tool, fetch_json
+
+QUOTABLE_RANDOM_URL = "https://api.quotable.io/random"
 
 
 @tool
@@ -24,35 +26,49 @@ def get_trending_books(query: str = "trending"):
     """
     try:
         # Use Open Library API (free, no key required)
-        url = f"{APIConfig.OPEN_LIBRARY_BASE_URL}/search.json"
-        params = {
-            "title": query,
-            "limit": 10,
-            "sort": "-key"
-        }
-        
-        response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        
-        books = []
-        for doc in data.get("docs", [])[:10]:
-            book = {
-                "title": doc.get("title", "Unknown"),
-                "authors": doc.get("author_name", ["Unknown"]),
-                "publishedDate": doc.get("first_publish_year", "N/A"),
-                "link": f"https://openlibrary.org{doc.get('key', '')}" if doc.get('key') else "",
-                "isbn": doc.get("isbn", ["N/A"])[0] if doc.get("isbn") else "N/A",
-            }
-            books.append(book)
-        
-        return books if books else _get_default_books()
+        url, params = _books_request(query)
+        return _format_books(fetch_json(url, params=params, source="get_trending_books"))
         
     except Exception as e:
         print(f"Error fetching books: {str(e)}")
         return _get_default_books()
 
 
+@async_tool(get_trending_books)
+async def aget_trending_books(query: str = "trending"):
+    try:
+        url, params = _books_request(query)
+        return _format_books(await afetch_json(url, params=params, source="get_trending_books"))
+    except Exception as e:
+        print(f"Error fetching books: {str(e)}")
+        return _get_default_books()
+
+
+def _books_request(query: str):
+    url = f"{APIConfig.OPEN_LIBRARY_BASE_URL}/search.json"
+    params = {
+        "title": query,
+        "limit": 10,
+        "sort": "-key"
+    }
+    return url, params
+
+
+def _format_books(data: dict):
+    books = []
+    for doc in data.get("docs", [])[:10]:
+        book = {
+            "title": doc.get("title", "Unknown"),
+            "authors": doc.get("author_name", ["Unknown"]),
+            "publishedDate": doc.get("first_publish_year", "N/A"),
+            "link": f"https://openlibrary.org{doc.get('key', '')}" if doc.get('key') else "",
+            "isbn": doc.get("isbn", ["N/A"])[0] if doc.get("isbn") else "N/A",
+        }
+        books.append(book)
+    
+    return books if books else _get_default_books()
+
+
 def _get_default_books():
     """Return default books when API fails."""
     return [
@@ -112,43 +128,62 @@ def get_best_food(cuisine: Optional[str] = None):
             print("Yelp API key not configured, using mock data")
             return _get_default_restaurants(cuisine)
         
-        headers = {
-            "Authorization": f"Bearer {APIConfig.YELP_API_KEY}"
-        }
-        
-        url = f"{APIConfig.YELP_BASE_URL}/businesses/search"
-        params = {
-            "location": APIConfig.DEFAULT_LOCATION,
-            "categories": cuisine or "restaurants",
-            "limit": 10,
-            "sort_by": "rating"
-        }
-        
-        response = requests.get(url, headers=headers, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
+        url, params, headers = _yelp_request(cuisine)
+        data = fetch_json(url, headers=headers, params=params, source="get_best_food")
+        return _format_restaurants(data, cuisine)
         
-        restaurants = []
-        for business in data.get("businesses", []):
-            restaurant = {
-                "name": business.get("name", ""),
-                "cuisine": cuisine or "Restaurant",
-                "rating": f"{business.get('rating', 0)}/5",
-                "reviews": business.get("review_count", 0),
-                "price": business.get("price", "$$"),
-                "address": " ".join(business.get("location", {}).get("display_address", [])),
-                "phone": business.get("phone", ""),
-                "link": business.get("url", ""),
-            }
-            restaurants.append(restaurant)
-        
-        return restaurants if restaurants else _get_default_restaurants(cuisine)
+    except Exception as e:
+        print(f"Error fetching restaurants: {str(e)}")
+        return _get_default_restaurants(cuisine)
+
+
+@async_tool(get_best_food)
+async def aget_best_food(cuisine: Optional[str] = None):
+    try:
+        if not APIConfig.YELP_API_KEY:
+            return _get_default_restaurants(cuisine)
         
+        url, params, headers = _yelp_request(cuisine)
+        data = await afetch_json(url, params=params, headers=headers, source="get_best_food")
+        return _format_restaurants(data, cuisine)
     except Exception as e:
         print(f"Error fetching restaurants: {str(e)}")
         return _get_default_restaurants(cuisine)
 
 
+def _yelp_request(cuisine: Optional[str]):
+    headers = {
+        "Authorization": f"Bearer {APIConfig.YELP_API_KEY}"
+    }
+    
+    url = f"{APIConfig.YELP_BASE_URL}/businesses/search"
+    params = {
+        "location": APIConfig.DEFAULT_LOCATION,
+        "categories": cuisine or "restaurants",
+        "limit": 10,
+        "sort_by": "rating"
+    }
+    return url, params, headers
+
+
+def _format_restaurants(data: dict, cuisine: Optional[str]):
+    restaurants = []
+    for business in data.get("businesses", []):
+        restaurant = {
+            "name": business.get("name", ""),
+            "cuisine": cuisine or "Restaurant",
+            "rating": f"{business.get('rating', 0)}/5",
+            "reviews": business.get("review_count", 0),
+            "price": business.get("price", "$$"),
+            "address": " ".join(business.get("location", {}).get("display_address", [])),
+            "phone": business.get("phone", ""),
+            "link": business.get("url", ""),
+        }
+        restaurants.append(restaurant)
+    
+    return restaurants if restaurants else _get_default_restaurants(cuisine)
+
+
 def _get_default_restaurants(cuisine: Optional[str] = None):
     """Return default restaurants when API fails."""
     if cuisine == "italian":
@@ -211,20 +246,28 @@ def _get_default_restaurants(cuisine: Optional[str] = None):
 def get_quote_of_day() -> Dict[str, str]:
     """Get the quote of the day from Quotable API."""
     try:
-        url = "https://api.quotable.io/random"
-        response = requests.get(url, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        
-        return {
-            "text": data.get("content", ""),
-            "author": data.get("author", "Unknown")
-        }
+        return _format_quote(fetch_json(QUOTABLE_RANDOM_URL, source="get_quote_of_day"))
     except Exception as e:
         print(f"Error fetching quote: {str(e)}")
         return _get_default_quote()
 
 
+@async_tool(get_quote_of_day)
+async def aget_quote_of_day() -> Dict[str, str]:
+    try:
+        return _format_quote(await afetch_json(QUOTABLE_RANDOM_URL, source="get_quote_of_day"))
+    except Exception as e:
+        print(f"Error fetching quote: {str(e)}")
+        return _get_default_quote()
+
+
+def _format_quote(data: dict) -> Dict[str, str]:
+    return {
+        "text": data.get("content", ""),
+        "author": data.get("author", "Unknown")
+    }
+
+
 def _get_default_quote() -> Dict[str, str]:
     """Return default inspirational quote when API fails."""
     fallback_quotes = [
@@ -249,22 +292,39 @@ def get_trending_movies() -> str:
             "language": "en-US"
         }
         
-        response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
+        return _format_trending_movies(fetch_json(url, params=params, source="get_trending_movies"))
         
-        movies = data.get("results", [])[:10]
-        result = "🎬 Trending Movies:\n\n"
-        for movie in movies:
-            result += f"• {movie.get('title', 'N/A')} (⭐ {movie.get('vote_average', 'N/A')}/10)\n"
-        
-        return result if result != "🎬 Trending Movies:\n\n" else _get_default_movies_info()
+    except Exception as e:
+        print(f"Error fetching trending movies: {str(e)}")
+        return _get_default_movies_info()
+
+
+@async_tool(get_trending_movies)
+async def aget_trending_movies() -> str:
+    try:
+        if not APIConfig.TMDB_API_KEY:
+            return _get_default_movies_info()
         
+        url = f"{APIConfig.TMDB_BASE_URL}/trending/movie/week"
+        params = {
+            "api_key": APIConfig.TMDB_API_KEY,
+            "language": "en-US"
+        }
+        return _format_trending_movies(await afetch_json(url, params=params, source="get_trending_movies"))
     except Exception as e:
         print(f"Error fetching trending movies: {str(e)}")
         return _get_default_movies_info()
 
 
+def _format_trending_movies(data: dict) -> str:
+    movies = data.get("results", [])[:10]
+    result = "🎬 Trending Movies:\n\n"
+    for movie in movies:
+        result += f"• {movie.get('title', 'N/A')} (⭐ {movie.get('vote_average', 'N/A')}/10)\n"
+    
+    return result if result != "🎬 Trending Movies:\n\n" else _get_default_movies_info()
+
+
 @tool
 def get_now_playing_movies() -> str:
     """Get movies currently playing in theaters from TMDB API."""
@@ -278,22 +338,39 @@ def get_now_playing_movies() -> str:
             "region": APIConfig.DEFAULT_COUNTRY
         }
         
-        response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        
-        movies = data.get("results", [])[:8]
-        result = "🎭 Movies Now Playing:\n\n"
-        for movie in movies:
-            result += f"• {movie.get('title', 'N/A')}\n"
+        return _format_now_playing(fetch_json(url, params=params, source="get_now_playing_movies"))
         
-        return result if result != "🎭 Movies Now Playing:\n\n" else _get_default_now_playing()
+    except Exception as e:
+        print(f"Error fetching now playing movies: {str(e)}")
+        return _get_default_now_playing()
+
+
+@async_tool(get_now_playing_movies)
+async def aget_now_playing_movies() -> str:
+    try:
+        if not APIConfig.TMDB_API_KEY:
+            return _get_default_now_playing()
         
+        url = f"{APIConfig.TMDB_BASE_URL}/movie/now_playing"
+        params = {
+            "api_key": APIConfig.TMDB_API_KEY,
+            "region": APIConfig.DEFAULT_COUNTRY
+        }
+        return _format_now_playing(await afetch_json(url, params=params, source="get_now_playing_movies"))
     except Exception as e:
         print(f"Error fetching now playing movies: {str(e)}")
         return _get_default_now_playing()
 
 
+def _format_now_playing(data: dict) -> str:
+    movies = data.get("results", [])[:8]
+    result = "🎭 Movies Now Playing:\n\n"
+    for movie in movies:
+        result += f"• {movie.get('title', 'N/A')}\n"
+    
+    return result if result != "🎭 Movies Now Playing:\n\n" else _get_default_now_playing()
+
+
 @tool
 def get_trending_shows() -> str:
     """Fetch trending TV shows from TMDB API."""
@@ -307,22 +384,39 @@ def get_trending_shows() -> str:
             "language": "en-US"
         }
         
-        response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        
-        shows = data.get("results", [])[:10]
-        result = "📺 Trending TV Shows:\n\n"
-        for show in shows:
-            result += f"• {show.get('name', 'N/A')} (⭐ {show.get('vote_average', 'N/A')}/10)\n"
+        return _format_trending_shows(fetch_json(url, params=params, source="get_trending_shows"))
         
-        return result if result != "📺 Trending TV Shows:\n\n" else _get_default_shows_info()
+    except Exception as e:
+        print(f"Error fetching trending shows: {str(e)}")
+        return _get_default_shows_info()
+
+
+@async_tool(get_trending_shows)
+async def aget_trending_shows() -> str:
+    try:
+        if not APIConfig.TMDB_API_KEY:
+            return _get_default_shows_info()
         
+        url = f"{APIConfig.TMDB_BASE_URL}/trending/tv/week"
+        params = {
+            "api_key": APIConfig.TMDB_API_KEY,
+            "language": "en-US"
+        }
+        return _format_trending_shows(await afetch_json(url, params=params, source="get_trending_shows"))
     except Exception as e:
         print(f"Error fetching trending shows: {str(e)}")
         return _get_default_shows_info()
 
 
+def _format_trending_shows(data: dict) -> str:
+    shows = data.get("results", [])[:10]
+    result = "📺 Trending TV Shows:\n\n"
+    for show in shows:
+        result += f"• {show.get('name', 'N/A')} (⭐ {show.get('vote_average', 'N/A')}/10)\n"
+    
+    return result if result != "📺 Trending TV Shows:\n\n" else _get_default_shows_info()
+
+
 @tool
 def search_movies(query: str) -> str:
     """Search for movies by title or keyword using TMDB API.
@@ -344,22 +438,40 @@ def search_movies(query: str) -> str:
             "language": "en-US"
         }
         
-        response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        
-        movies = data.get("results", [])[:5]
-        result = f"🔍 Search results for '{query}':\n\n"
-        for movie in movies:
-            result += f"• {movie.get('title', 'N/A')} ({movie.get('release_date', 'N/A')[:4]})\n"
+        return _format_movie_search(fetch_json(url, params=params, source="search_movies"), query)
         
-        return result if movies else f"No results found for '{query}'"
+    except Exception as e:
+        print(f"Error searching movies: {str(e)}")
+        return f"Error searching for '{query}'"
+
+
+@async_tool(search_movies)
+async def asearch_movies(query: str) -> str:
+    try:
+        if not APIConfig.TMDB_API_KEY:
+            return f"Search results for '{query}': Configure TMDB_API_KEY to enable real search"
         
+        url = f"{APIConfig.TMDB_BASE_URL}/search/movie"
+        params = {
+            "api_key": APIConfig.TMDB_API_KEY,
+            "query": query,
+            "language": "en-US"
+        }
+        return _format_movie_search(await afetch_json(url, params=params, source="search_movies"), query)
     except Exception as e:
         print(f"Error searching movies: {str(e)}")
         return f"Error searching for '{query}'"
 
 
+def _format_movie_search(data: dict, query: str) -> str:
+    movies = data.get("results", [])[:5]
+    result = f"🔍 Search results for '{query}':\n\n"
+    for movie in movies:
+        result += f"• {movie.get('title', 'N/A')} ({movie.get('release_date', 'N/A')[:4]})\n"
+    
+    return result if movies else f"No results found for '{query}'"
+
+
 def _get_default_movies_info() -> str:
     """Return default movies info when API fails."""
     return "🎬 Trending Movies:\n\nConfigure TMDB_API_KEY for real trending data\n• Visit https://www.themoviedb.org/ for API key"
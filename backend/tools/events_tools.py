@@ -3,13 +3,13 @@
 import os
 import sys
 from pathlib import Path
-import requests
 from langchain.tools import tool
 from typing import Optional, List, Dict
 
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import APIConfig
+from .utils import afetch_json, async_tool, fetch_json
 
 
 @tool
@@ -29,42 +29,65 @@ def get_events_nearby(
     """
     try:
         if APIConfig.TICKETMASTER_API_KEY:
-            url = f"{APIConfig.TICKETMASTER_BASE_URL}/events.json"
-            params = {
-                "apikey": APIConfig.TICKETMASTER_API_KEY,
-                "keyword": category or "",
-                "radius": radius,
-                "unit": unit,
-                "locale": "*",
-            }
-            if location:
-                params["city"] = location
-
-            response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
-
-            events = []
-            for item in data.get("_embedded", {}).get("events", [])[:15]:
-                venue = (item.get("_embedded", {}).get("venues") or [{}])[0]
-                events.append({
-                    "name": item.get("name"),
-                    "date": item.get("dates", {}).get("start", {}).get("localDate"),
-                    "time": item.get("dates", {}).get("start", {}).get("localTime"),
-                    "venue": venue.get("name"),
-                    "city": venue.get("city", {}).get("name"),
-                    "country": venue.get("country", {}).get("countryCode"),
-                    "url": item.get("url"),
-                    "category": category or "Event",
-                })
-
-            return events if events else _get_default_events(location, category)
+            url, params = _ticketmaster_request(location, radius, unit, category)
+            data = fetch_json(url, params=params, source="get_events_nearby")
+            return _format_events(data, location, category)
 
         return _get_default_events(location, category)
     except Exception:
         return _get_default_events(location, category)
 
 
+@async_tool(get_events_nearby)
+async def aget_events_nearby(
+    location: Optional[str] = None,
+    radius: int = 25,
+    unit: str = "miles",
+    category: Optional[str] = None,
+) -> List[Dict]:
+    try:
+        if APIConfig.TICKETMASTER_API_KEY:
+            url, params = _ticketmaster_request(location, radius, unit, category)
+            data = await afetch_json(url, params=params, source="get_events_nearby")
+            return _format_events(data, location, category)
+
+        return _get_default_events(location, category)
+    except Exception:
+        return _get_default_events(location, category)
+
+
+def _ticketmaster_request(location: Optional[str], radius: int, unit: str, category: Optional[str]):
+    url = f"{APIConfig.TICKETMASTER_BASE_URL}/events.json"
+    params = {
+        "apikey": APIConfig.TICKETMASTER_API_KEY,
+        "keyword": category or "",
+        "radius": radius,
+        "unit": unit,
+        "locale": "*",
+    }
+    if location:
+        params["city"] = location
+    return url, params
+
+
+def _format_events(data: dict, location: Optional[str], category: Optional[str]) -> List[Dict]:
+    events = []
+    for item in data.get("_embedded", {}).get("events", [])[:15]:
+        venue = (item.get("_embedded", {}).get("venues") or [{}])[0]
+        events.append({
+            "name": item.get("name"),
+            "date": item.get("dates", {}).get("start", {}).get("localDate"),
+            "time": item.get("dates", {}).get("start", {}).get("localTime"),
+            "venue": venue.get("name"),
+            "city": venue.get("city", {}).get("name"),
+            "country": venue.get("country", {}).get("countryCode"),
+            "url": item.get("url"),
+            "category": category or "Event",
+        })
+
+    return events if events else _get_default_events(location, category)
+
+
 def _get_default_events(location: Optional[str], category: Optional[str]) -> List[Dict]:
     city = location or os.getenv("DEFAULT_LOCATION", "New York, NY")
     label = category or "Community"
@@ -28,7 +28,7 @@ def get_github_trending(language: Optional[str] = None, spoken_language: str = "
             params["q"] += f" language:{language}"
         
         url = f"{url}?{'&'.join(f'{k}={urllib.parse.quote(str(v))}' for k,v in params.items())}"
-        data = fetch_json(url)
+        data = fetch_json(url, source="get_github_trending")
         
         # Return array of repo objects for frontend compatibility
         repos = []
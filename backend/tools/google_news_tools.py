@@ -1,7 +1,7 @@
 """Google News tools for fetching top news stories."""
 
 from langchain.tools import tool
-from .utils import fetch_xml, parse_rss
+from .utils import fetch_feed
 from typing import Optional
 
 
@@ -23,8 +23,7 @@ def get_google_news(topic: Optional[str] = None, country: str = "US", lang: str
         else:
             url = f"https://news.google.com/rss?hl={lang}&gl={country}&ceid={country}:{lang}"
         
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
+        items = fetch_feed(url, 10)
         
         # Return array of items for frontend compatibility
         return items[:10]
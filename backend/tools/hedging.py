@@ -0,0 +1,64 @@
+"""When to hedge an upstream GET, and how many hedges each host can afford."""
+
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .circuit_breaker import breaker_for
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+
+class HedgeBudget:
+    """Token bucket limiting hedges to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens (up to ``burst``) and every hedge
+    spends one, so over time at most ``ratio`` extra load reaches the host.
+    """
+
+    def __init__(self, ratio: float, burst: float):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+_budgets: Dict[str, HedgeBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def budget_for(host: str) -> HedgeBudget:
+    budget = _budgets.get(host)
+    if budget is None:
+        with _budgets_lock:
+            budget = _budgets.setdefault(host, HedgeBudget(APIConfig.HEDGE_BUDGET_RATIO, APIConfig.HEDGE_BURST))
+    return budget
+
+
+def hedge_delay(host: str) -> Optional[float]:
+    """Seconds to wait before hedging a request to host, or None to not hedge it.
+
+    The delay is the host's observed latency percentile (HEDGE_PERCENTILE,
+    from the latencies its circuit breaker records), once enough samples exist.
+    """
+    if host not in APIConfig.HEDGE_HOSTS:
+        return None
+    breaker = breaker_for(host)
+    if len(breaker.latencies) < APIConfig.HEDGE_MIN_SAMPLES:
+        return None
+    delay = breaker.latency_percentile(APIConfig.HEDGE_PERCENTILE)
+    return max(APIConfig.HEDGE_MIN_DELAY, delay) if delay is not None else None
@@ -0,0 +1,128 @@
+"""Process-wide pooled HTTP client shared by the fetch helpers in utils."""
+
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+
+def _accept_encoding() -> str:
+    """Content codings to advertise: brotli and zstd when this httpx can decode them.
+
+    httpx only registers those decoders when their optional packages are
+    installed, and zstd only from 0.27.1 on, so its decoder table is checked
+    rather than whether the package imports.
+    """
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:  # layout changed: stick to codings every httpx decodes
+        SUPPORTED_DECODERS = {}
+    codings = [coding for coding in ("zstd", "br") if coding in SUPPORTED_DECODERS]
+    return ", ".join(codings + ["gzip", "deflate"])
+
+
+DEFAULT_HEADERS = {"User-Agent": "daily-log-api-langchain/2.0", "Accept-Encoding": _accept_encoding()}
+
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 is only negotiated when enabled and the optional `h2` package is installed."""
+    if not APIConfig.HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _limits(max_connections: Optional[int] = None) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections or APIConfig.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=min(
+            APIConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections or APIConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        keepalive_expiry=APIConfig.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _build_client() -> httpx.Client:
+    """Create a keep-alive client with a dedicated connection pool per configured host."""
+    http2 = _http2_available()
+    mounts = {
+        f"all://{host}": httpx.HTTPTransport(limits=_limits(limit), http2=http2)
+        for host, limit in APIConfig.HTTP_HOST_CONNECTION_LIMITS.items()
+    }
+    return httpx.Client(
+        headers=DEFAULT_HEADERS,
+        limits=_limits(),
+        http2=http2,
+        mounts=mounts,
+        follow_redirects=True,
+    )
+
+
+def _build_async_client() -> httpx.AsyncClient:
+    """Async counterpart of _build_client with the same pool layout."""
+    http2 = _http2_available()
+    mounts = {
+        f"all://{host}": httpx.AsyncHTTPTransport(limits=_limits(limit), http2=http2)
+        for host, limit in APIConfig.HTTP_HOST_CONNECTION_LIMITS.items()
+    }
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        limits=_limits(),
+        http2=http2,
+        mounts=mounts,
+        follow_redirects=True,
+    )
+
+
+def get_client() -> httpx.Client:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        with _client_lock:
+            if _client is None or _client.is_closed:
+                _client = _build_client()
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared async client, creating it on first use.
+
+    The async client belongs to the event loop that first uses it, which is the
+    server loop when opened from the FastAPI lifespan.
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = _build_async_client()
+    return _async_client
+
+
+def open_clients():
+    """Warm up the shared client pools (called on app startup)."""
+    get_client()
+    get_async_client()
+
+
+async def close_clients():
+    """Close the shared client pools and drop their idle connections (called on app shutdown)."""
+    global _client, _async_client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
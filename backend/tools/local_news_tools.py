@@ -1,7 +1,7 @@
 """Local news tools for fetching regional news stories."""
 
 from langchain.tools import tool
-from .utils import fetch_xml, parse_rss
+from .utils import fetch_feed
 
 
 @tool
@@ -9,8 +9,7 @@ def get_local_news():
     """Fetch local news stories."""
     try:
         url = "https://news.google.com/rss?hl=en&gl=US&ceid=US:en"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
+        items = fetch_feed(url, 10)
         
         # Return array of items for frontend compatibility
         return items[:10]
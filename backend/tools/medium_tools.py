@@ -1,7 +1,7 @@
 """Medium platform tools for fetching trending stories."""
 
 from langchain.tools import tool
-from .utils import fetch_xml, parse_rss
+from .utils import fetch_feed
 
 
 @tool
@@ -9,8 +9,7 @@ def get_medium_trending():
     """Fetch trending stories from Medium."""
     try:
         url = "https://medium.com/feed/tag/trending"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
+        items = fetch_feed(url, 10)
         
         # Return array of items for frontend compatibility
         return items[:10]  # Return top 10 stories as array
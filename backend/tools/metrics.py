@@ -0,0 +1,25 @@
+"""Process-wide counters for the fetch layer (revalidations, aborts, rejections...)."""
+
+import threading
+from collections import Counter
+from typing import Dict
+
+_counters = Counter()
+_lock = threading.Lock()
+
+
+def increment(name: str, amount: int = 1):
+    """Add amount to a named counter, e.g. ``increment("revalidate.not_modified")``."""
+    with _lock:
+        _counters[name] += amount
+
+
+def snapshot() -> Dict[str, int]:
+    """Return a copy of all counters, sorted by name."""
+    with _lock:
+        return dict(sorted(_counters.items()))
+
+
+def reset():
+    with _lock:
+        _counters.clear()
@@ -1,11 +1,49 @@
 """News tools for fetching trending news and stories."""
 
 from langchain.tools import tool
-from .utils import fetch_xml, fetch_json, parse_rss
+from .utils import fetch_feed, afetch_feed, async_tool
 from typing import Optional
 import urllib.parse
 import os
 
+GOOGLE_NEWS_TOPICS = {"WORLD", "NATION", "BUSINESS", "TECHNOLOGY", "ENTERTAINMENT", "SPORTS", "SCIENCE", "HEALTH"}
+MEDIUM_TRENDING_URL = "https://medium.com/feed/tag/trending"
+HASHNODE_FEED_URL = "https://hashnode.com/feed"
+HACKERNEWS_FRONTPAGE_URL = "https://hnrss.org/frontpage"
+REDDIT_PROGRAMMING_URL = "https://www.reddit.com/r/programming/.rss"
+
+
+def _google_news_url(topic: Optional[str], country: str, lang: str) -> str:
+    if topic and topic.upper() in GOOGLE_NEWS_TOPICS:
+        return f"https://news.google.com/rss/topics/{topic.upper()}?hl={lang}&gl={country}&ceid={country}:{lang}"
+    return f"https://news.google.com/rss?hl={lang}&gl={country}&ceid={country}:{lang}"
+
+
+def _local_news_url(location: Optional[str], country: str, lang: str) -> str:
+    location_query = location or os.getenv("DEFAULT_LOCATION", "New York, NY")
+    query = urllib.parse.quote(location_query)
+    return f"https://news.google.com/rss/search?q={query}&hl={lang}&gl={country}&ceid={country}:{lang}"
+
+
+def _devto_url(tag: Optional[str]) -> str:
+    return f"https://dev.to/feed/tag/{tag}" if tag else "https://dev.to/feed"
+
+
+def _top_items(url: str, limit: int = 10):
+    """Fetch a feed and return its first items, or [] if it can't be fetched."""
+    try:
+        return fetch_feed(url, limit)
+    except Exception as e:
+        return []
+
+
+async def _atop_items(url: str, limit: int = 10):
+    """Async counterpart of _top_items."""
+    try:
+        return await afetch_feed(url, limit)
+    except Exception as e:
+        return []
+
 
 @tool
 def get_google_news(topic: Optional[str] = None, country: str = "US", lang: str = "en"):
@@ -19,19 +57,13 @@ def get_google_news(topic: Optional[str] = None, country: str = "US", lang: str
     Returns:
         Array of news items with title, link, and pubDate
     """
-    try:
-        if topic and topic.upper() in {"WORLD", "NATION", "BUSINESS", "TECHNOLOGY", "ENTERTAINMENT", "SPORTS", "SCIENCE", "HEALTH"}:
-            url = f"https://news.google.com/rss/topics/{topic.upper()}?hl={lang}&gl={country}&ceid={country}:{lang}"
-        else:
-            url = f"https://news.google.com/rss?hl={lang}&gl={country}&ceid={country}:{lang}"
-        
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        
-        # Return array of items for frontend compatibility
-        return items[:10]
-    except Exception as e:
-        return []
+    # Return array of items for frontend compatibility
+    return _top_items(_google_news_url(topic, country, lang))
+
+
+@async_tool(get_google_news)
+async def aget_google_news(topic: Optional[str] = None, country: str = "US", lang: str = "en"):
+    return await _atop_items(_google_news_url(topic, country, lang))
 
 
 @tool
@@ -43,53 +75,46 @@ def get_local_news(location: Optional[str] = None, country: str = "US", lang: st
         country: Country code (US, GB, IN, etc.)
         lang: Language code (en, es, fr, etc.)
     """
-    try:
-        location_query = location or os.getenv("DEFAULT_LOCATION", "New York, NY")
-        query = urllib.parse.quote(location_query)
-        url = f"https://news.google.com/rss/search?q={query}&hl={lang}&gl={country}&ceid={country}:{lang}"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(_local_news_url(location, country, lang))
+
+
+@async_tool(get_local_news)
+async def aget_local_news(location: Optional[str] = None, country: str = "US", lang: str = "en"):
+    return await _atop_items(_local_news_url(location, country, lang))
 
 
 @tool
 def get_country_news(country: str = "US", lang: str = "en"):
     """Fetch country-specific national news (NATION topic)."""
-    try:
-        url = f"https://news.google.com/rss/topics/NATION?hl={lang}&gl={country}&ceid={country}:{lang}"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(_google_news_url("NATION", country, lang))
+
+
+@async_tool(get_country_news)
+async def aget_country_news(country: str = "US", lang: str = "en"):
+    return await _atop_items(_google_news_url("NATION", country, lang))
 
 
 @tool
 def get_international_news(lang: str = "en", country: str = "US"):
     """Fetch international/world news (WORLD topic)."""
-    try:
-        url = f"https://news.google.com/rss/topics/WORLD?hl={lang}&gl={country}&ceid={country}:{lang}"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(_google_news_url("WORLD", country, lang))
+
+
+@async_tool(get_international_news)
+async def aget_international_news(lang: str = "en", country: str = "US"):
+    return await _atop_items(_google_news_url("WORLD", country, lang))
 
 
 @tool
 def get_medium_trending():
     """Fetch trending stories from Medium."""
-    try:
-        url = "https://medium.com/feed/tag/trending"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        
-        # Return array of items for frontend compatibility
-        return items[:10]  # Return top 10 stories as array
-    except Exception as e:
-        return []
+    # Return array of items for frontend compatibility
+    return _top_items(MEDIUM_TRENDING_URL)
+
+
+@async_tool(get_medium_trending)
+async def aget_medium_trending():
+    return await _atop_items(MEDIUM_TRENDING_URL)
 
 
 @tool
@@ -99,46 +124,42 @@ def get_devto_trending(tag: Optional[str] = None):
     Args:
         tag: Optional tag to filter by (e.g., "python", "javascript")
     """
-    try:
-        url = f"https://dev.to/feed/tag/{tag}" if tag else "https://dev.to/feed"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(_devto_url(tag))
+
+
+@async_tool(get_devto_trending)
+async def aget_devto_trending(tag: Optional[str] = None):
+    return await _atop_items(_devto_url(tag))
 
 
 @tool
 def get_hashnode_trending():
     """Fetch trending stories from Hashnode."""
-    try:
-        url = "https://hashnode.com/feed"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(HASHNODE_FEED_URL)
+
+
+@async_tool(get_hashnode_trending)
+async def aget_hashnode_trending():
+    return await _atop_items(HASHNODE_FEED_URL)
 
 
 @tool
 def get_hackernews_top():
     """Fetch top stories from Hacker News (RSS)."""
-    try:
-        url = "https://hnrss.org/frontpage"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(HACKERNEWS_FRONTPAGE_URL)
+
+
+@async_tool(get_hackernews_top)
+async def aget_hackernews_top():
+    return await _atop_items(HACKERNEWS_FRONTPAGE_URL)
 
 
 @tool
 def get_reddit_programming():
     """Fetch top programming posts from Reddit RSS."""
-    try:
-        url = "https://www.reddit.com/r/programming/.rss"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        return items[:10]
-    except Exception as e:
-        return []
+    return _top_items(REDDIT_PROGRAMMING_URL)
+
+
+@async_tool(get_reddit_programming)
+async def aget_reddit_programming():
+    return await _atop_items(REDDIT_PROGRAMMING_URL)
@@ -9,7 +9,7 @@ def get_quote_of_day():
     """Get the quote of the day."""
     try:
         url = "https://api.quotable.io/random"
-        data = fetch_json(url)
+        data = fetch_json(url, source="get_quote_of_day")
         # Return object for frontend compatibility
         return {
             "text": data.get("content", ""),
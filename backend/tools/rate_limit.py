@@ -0,0 +1,194 @@
+"""Spend quota-limited upstreams' request budgets on the keys that matter most.
+
+Hosts listed in APIConfig.RATE_LIMITS (GitHub, TMDB, Yelp, Ticketmaster)
+get a RateBudget that follows the quota the upstream reports in its
+response headers (X-RateLimit-*, RateLimit-*, Rate-Limit-*, Retry-After).
+While plenty of quota is left every request goes through. Once it drops
+to the host's reserve, the rest is kept for:
+
+  * requests with nothing cached to fall back on,
+  * conditional revalidations, which GitHub doesn't count when they 304,
+  * refreshes of the host's hottest keys (by recent request rate).
+
+Other refreshes are deferred and callers keep getting the cached value.
+When the quota is exhausted, or after a 429 / Retry-After, nothing is sent
+until it resets.
+"""
+
+import email.utils
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining", "rate-limit-available")
+_LIMIT_HEADERS = ("x-ratelimit-limit", "ratelimit-limit", "ratelimit-dailylimit", "rate-limit")
+# Reset header -> how to read it: epoch seconds, epoch milliseconds, seconds from now, or an ISO timestamp
+_RESET_HEADERS = (
+    ("x-ratelimit-reset", "epoch"),
+    ("rate-limit-reset", "epoch_ms"),
+    ("ratelimit-reset", "delta"),
+    ("ratelimit-resettime", "iso"),
+)
+
+
+class RateLimited(httpx.HTTPError):
+    """The upstream's request budget is spent or reserved for other keys; the request was not sent."""
+
+
+def _parse_reset(value: str, kind: str, now: float) -> Optional[float]:
+    try:
+        if kind == "epoch":
+            return float(value)
+        if kind == "epoch_ms":
+            return float(value) / 1000
+        if kind == "delta":
+            return now + float(value)
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: str, now: float) -> Optional[float]:
+    """Retry-After as an absolute time; it may be delta-seconds or an HTTP date."""
+    if value.strip().isdigit():
+        return now + int(value)
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class RateBudget:
+    """Quota tracker and admission policy for one rate-limited upstream host."""
+
+    def __init__(self, host: str, reserve: int, hot_keys: int, half_life: float = 600):
+        self.host = host
+        self.reserve = reserve
+        self.hot_keys = hot_keys
+        self.half_life = half_life
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.deferred = 0
+        self.rejected = 0
+        self._heat: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record_use(self, key: str):
+        """Count a request for key; heat decays with half_life so recent demand dominates."""
+        now = time.time()
+        with self._lock:
+            score, at = self._heat.get(key, (0.0, now))
+            self._heat[key] = [score * 0.5 ** ((now - at) / self.half_life) + 1, now]
+            if len(self._heat) > 1000:
+                coldest = sorted(self._heat, key=lambda k: self._score(k, now))[:len(self._heat) - 800]
+                for k in coldest:
+                    del self._heat[k]
+
+    def _score(self, key: str, now: float) -> float:
+        score, at = self._heat.get(key, (0.0, now))
+        return score * 0.5 ** ((now - at) / self.half_life)
+
+    def _is_hot(self, key: str, now: float) -> bool:
+        mine = self._score(key, now)
+        hotter = sum(1 for k in self._heat if k != key and self._score(k, now) > mine)
+        return hotter < self.hot_keys
+
+    def admit(self, key: str, refresh: bool, conditional: bool) -> Optional[str]:
+        """None if a request for key may be sent now, otherwise why not.
+
+        refresh: there is a cached value to serve instead (a low-priority fetch).
+        conditional: the request carries validators and will likely be a cheap 304.
+        """
+        now = time.time()
+        with self._lock:
+            if now < self.blocked_until:
+                self.rejected += 1
+                return f"rate limited for {self.blocked_until - now:.0f}s more"
+            if self.remaining is None or now >= self.reset_at:
+                return None
+            if self.remaining <= 0:
+                self.rejected += 1
+                return f"quota exhausted, resets in {self.reset_at - now:.0f}s"
+            if self.remaining <= self.reserve and refresh and not conditional and not self._is_hot(key, now):
+                self.deferred += 1
+                return f"quota low ({self.remaining} left), refresh deferred"
+            if not conditional:
+                # Spend locally until the response reports the real figure
+                self.remaining -= 1
+            return None
+
+    def observe(self, response: httpx.Response):
+        """Update the quota from a response's rate-limit headers and status."""
+        headers = response.headers
+        now = time.time()
+        with self._lock:
+            for name in _REMAINING_HEADERS:
+                if headers.get(name, "").isdigit():
+                    self.remaining = int(headers[name])
+                    break
+            for name in _LIMIT_HEADERS:
+                if headers.get(name, "").isdigit():
+                    self.limit = int(headers[name])
+                    break
+            for name, kind in _RESET_HEADERS:
+                if name in headers:
+                    reset_at = _parse_reset(headers[name], kind, now)
+                    if reset_at is not None:
+                        self.reset_at = reset_at
+                    break
+            retry_after = headers.get("retry-after")
+            exhausted = response.status_code == 429 or (response.status_code == 403 and self.remaining == 0)
+            if retry_after:
+                self.blocked_until = _parse_retry_after(retry_after, now) or now + 60
+            elif exhausted:
+                self.blocked_until = max(self.reset_at, now + 60) if self.reset_at > now else now + 60
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            hottest = sorted(self._heat, key=lambda k: self._score(k, now), reverse=True)[:self.hot_keys]
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_in": round(self.reset_at - now) if self.reset_at > now else None,
+                "blocked_for": round(self.blocked_until - now) if self.blocked_until > now else None,
+                "deferred": self.deferred,
+                "rejected": self.rejected,
+                "hot_keys": hottest,
+            }
+
+
+_budgets: Dict[str, RateBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def budget_for(host: str) -> Optional[RateBudget]:
+    """The budget of a rate-limited host, or None for hosts without one."""
+    settings = APIConfig.RATE_LIMITS.get(host)
+    if settings is None:
+        return None
+    budget = _budgets.get(host)
+    if budget is None:
+        with _budgets_lock:
+            budget = _budgets.get(host)
+            if budget is None:
+                budget = RateBudget(host, settings.get("reserve", 0), settings.get("hot_keys", 3))
+                _budgets[host] = budget
+    return budget
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    with _budgets_lock:
+        budgets = sorted(_budgets.items())
+    return {host: budget.stats() for host, budget in budgets}
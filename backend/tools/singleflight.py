@@ -0,0 +1,75 @@
+"""Per-key request coalescing so concurrent cache misses share one upstream fetch."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls for the same key.
+
+    The first caller for a key (the leader) runs the fetch; every caller that
+    arrives while it is in flight waits on the same result instead of issuing
+    its own request. Sync and async callers share one table of
+    ``concurrent.futures.Future`` objects, so a thread and a coroutine missing
+    the same key at the same moment also coalesce.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def _claim(self, key: str) -> Tuple[Future, bool]:
+        """Return the in-flight future for key and whether the caller is its leader."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Any = None, error: Optional[BaseException] = None):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """Run fn() once per key across concurrent callers and return its result."""
+        future, leader = self._claim(key)
+        if not leader:
+            return future.result(timeout)
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result=result)
+        return result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of do().
+
+        The leader's fetch runs as its own task, so a cancelled request (for
+        example a disconnected client) doesn't cancel the fetch other callers
+        are waiting on.
+        """
+        future, leader = self._claim(key)
+        if leader:
+            task = asyncio.ensure_future(fn())
+
+            def _done(t: asyncio.Task):
+                error = asyncio.CancelledError() if t.cancelled() else t.exception()
+                self._finish(key, future, result=None if error else t.result(), error=error)
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(asyncio.wrap_future(future))
@@ -1,7 +1,7 @@
 """Tech news tools for fetching technology news and trends."""
 
 from langchain.tools import tool
-from .utils import fetch_xml, parse_rss
+from .utils import fetch_feed
 
 
 @tool
@@ -9,8 +9,7 @@ def get_tech_news():
     """Fetch trending technology news and stories."""
     try:
         url = "https://news.google.com/rss/topics/TECHNOLOGY?hl=en&gl=US&ceid=US:en"
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
+        items = fetch_feed(url, 10)
         
         # Return array of news objects for frontend compatibility
         return items[:10]
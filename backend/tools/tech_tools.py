@@ -1,10 +1,54 @@
 """Tech and trending tools."""
 
+import sys
+from pathlib import Path
 from langchain.tools import tool
-from .utils import fetch_json, fetch_text
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+from .utils import fetch_json, fetch_text, fetch_feed, afetch_json, afetch_text, afetch_feed, async_tool
 from typing import Optional
 import urllib.parse
 
+TECH_NEWS_URL = "https://news.google.com/rss/topics/TECHNOLOGY?hl=en&gl=US&ceid=US:en"
+YOUTUBE_TRENDING_URL = "https://www.youtube.com/feed/trending?gl=US"
+YOUTUBE_TRENDING_TEXT = "YouTube Trending Videos: Visit https://www.youtube.com/feed/trending for real-time trending videos"
+
+
+def _github_search_url(language: Optional[str]) -> str:
+    url = "https://api.github.com/search/repositories"
+    params = {
+        "q": "stars:>1000 created:>2025-01-01",
+        "sort": "stars",
+        "order": "desc"
+    }
+    if language:
+        params["q"] += f" language:{language}"
+    
+    return f"{url}?{'&'.join(f'{k}={urllib.parse.quote(str(v))}' for k,v in params.items())}"
+
+
+def _github_headers() -> Optional[dict]:
+    """Authenticate when a token is configured: search quota rises from 10 to 30 requests a minute."""
+    if not APIConfig.GITHUB_API_KEY:
+        return None
+    return {"Authorization": f"Bearer {APIConfig.GITHUB_API_KEY}"}
+
+
+def _format_repos(data: dict):
+    """Shape GitHub search results as an array of repo objects for the frontend."""
+    repos = []
+    for r in data.get("items", [])[:10]:
+        repos.append({
+            "name": r.get("full_name", "Unknown"),
+            "description": r.get("description", ""),
+            "stars": r.get("stargazers_count", 0),
+            "language": r.get("language", ""),
+            "url": r.get("html_url", "")
+        })
+    return repos
+
 
 @tool
 def get_github_trending(language: Optional[str] = None, spoken_language: str = "en"):
@@ -18,29 +62,17 @@ def get_github_trending(language: Optional[str] = None, spoken_language: str = "
         Array of GitHub repository objects
     """
     try:
-        url = "https://api.github.com/search/repositories"
-        params = {
-            "q": "stars:>1000 created:>2025-01-01",
-            "sort": "stars",
-            "order": "desc"
-        }
-        if language:
-            params["q"] += f" language:{language}"
-        
-        url = f"{url}?{'&'.join(f'{k}={urllib.parse.quote(str(v))}' for k,v in params.items())}"
-        data = fetch_json(url)
-        
-        # Return array of repo objects for frontend compatibility
-        repos = []
-        for r in data.get("items", [])[:10]:
-            repos.append({
-                "name": r.get("full_name", "Unknown"),
-                "description": r.get("description", ""),
-                "stars": r.get("stargazers_count", 0),
-                "language": r.get("language", ""),
-                "url": r.get("html_url", "")
-            })
-        return repos
+        return _format_repos(fetch_json(_github_search_url(language), headers=_github_headers(),
+                                        source="get_github_trending"))
+    except Exception as e:
+        return []
+
+
+@async_tool(get_github_trending)
+async def aget_github_trending(language: Optional[str] = None, spoken_language: str = "en"):
+    try:
+        return _format_repos(await afetch_json(_github_search_url(language), headers=_github_headers(),
+                                               source="get_github_trending"))
     except Exception as e:
         return []
 
@@ -49,62 +81,77 @@ def get_github_trending(language: Optional[str] = None, spoken_language: str = "
 def get_tech_news():
     """Fetch trending technology news and stories."""
     try:
-        url = "https://news.google.com/rss/topics/TECHNOLOGY?hl=en&gl=US&ceid=US:en"
-        from .utils import fetch_xml, parse_rss
-        xml = fetch_xml(url)
-        items = parse_rss(xml)
-        
         # Return array of news objects for frontend compatibility
-        return items[:10]
+        return fetch_feed(TECH_NEWS_URL, 10)
     except Exception as e:
         # Fallback to curated tech news if RSS fails
-        return [
-            {
-                "title": "Latest AI Breakthroughs in 2026",
-                "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
-                "pubDate": "2026-02-02",
-                "score": 0,
-                "comments": 0
-            },
-            {
-                "title": "New Programming Languages Gaining Popularity",
-                "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
-                "pubDate": "2026-02-02",
-                "score": 0,
-                "comments": 0
-            },
-            {
-                "title": "Cloud Computing Trends for Enterprise",
-                "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
-                "pubDate": "2026-02-01",
-                "score": 0,
-                "comments": 0
-            },
-            {
-                "title": "Cybersecurity Best Practices in 2026",
-                "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
-                "pubDate": "2026-02-01",
-                "score": 0,
-                "comments": 0
-            },
-            {
-                "title": "Quantum Computing Makes New Advances",
-                "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
-                "pubDate": "2026-01-31",
-                "score": 0,
-                "comments": 0
-            }
-        ]
+        return _get_default_tech_news()
+
+
+@async_tool(get_tech_news)
+async def aget_tech_news():
+    try:
+        return await afetch_feed(TECH_NEWS_URL, 10)
+    except Exception as e:
+        return _get_default_tech_news()
+
+
+def _get_default_tech_news():
+    """Return curated tech news when the RSS feed fails."""
+    return [
+        {
+            "title": "Latest AI Breakthroughs in 2026",
+            "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
+            "pubDate": "2026-02-02",
+            "score": 0,
+            "comments": 0
+        },
+        {
+            "title": "New Programming Languages Gaining Popularity",
+            "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
+            "pubDate": "2026-02-02",
+            "score": 0,
+            "comments": 0
+        },
+        {
+            "title": "Cloud Computing Trends for Enterprise",
+            "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
+            "pubDate": "2026-02-01",
+            "score": 0,
+            "comments": 0
+        },
+        {
+            "title": "Cybersecurity Best Practices in 2026",
+            "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
+            "pubDate": "2026-02-01",
+            "score": 0,
+            "comments": 0
+        },
+        {
+            "title": "Quantum Computing Makes New Advances",
+            "url": "https://news.google.com/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtVnVHZ0pWVXlnQVAB",
+            "pubDate": "2026-01-31",
+            "score": 0,
+            "comments": 0
+        }
+    ]
 
 
 @tool
 def get_trending_videos() -> str:
     """Fetch trending videos from YouTube (via external API)."""
     try:
-        url = "https://www.youtube.com/feed/trending?gl=US"
-        text = fetch_text(url)
+        text = fetch_text(YOUTUBE_TRENDING_URL)
         # Simple parsing - extract video titles
-        videos_text = "YouTube Trending Videos: Visit https://www.youtube.com/feed/trending for real-time trending videos"
-        return videos_text
+        return YOUTUBE_TRENDING_TEXT
+    except Exception as e:
+        return f"Error fetching YouTube trends: {str(e)}"
+
+
+@async_tool(get_trending_videos)
+async def aget_trending_videos() -> str:
+    try:
+        text = await afetch_text(YOUTUBE_TRENDING_URL)
+        return YOUTUBE_TRENDING_TEXT
     except Exception as e:
         return f"Error fetching YouTube trends: {str(e)}"
@@ -1,6 +1,5 @@
 """Utility tools for weather, shopping, and gas prices using real APIs."""
 
-import requests
 import sys
 from pathlib import Path
 from langchain.tools import tool
@@ -9,6 +8,9 @@ from typing import Optional, List, Dict
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import APIConfig
+from .utils import afetch_json, afetch_text, async_tool, fetch_json, fetch_text
+
+WTTR_URL = "https://wttr.in?format=3"
 
 
 @tool
@@ -24,37 +26,54 @@ def get_local_weather(units: str = "C") -> str:
     try:
         # Try OpenWeatherMap first if key is available
         if APIConfig.WEATHER_API_KEY:
-            location = APIConfig.DEFAULT_LOCATION
-            url = f"{APIConfig.WEATHER_BASE_URL}/weather"
-            params = {
-                "q": location,
-                "appid": APIConfig.WEATHER_API_KEY,
-                "units": "metric" if units == "C" else "imperial"
-            }
-            response = requests.get(url, params=params, timeout=APIConfig.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
+            url, params = _openweather_request(units)
+            data = fetch_json(url, params=params, source="get_local_weather")
+            return _format_openweather(data, units)
+        else:
+            # Fallback to wttr.in (free, no key required)
+            text = fetch_text(WTTR_URL, source="get_local_weather")
+            return f"Weather:\n\n{text}"
             
-            weather = data.get("main", {})
-            description = data.get("weather", [{}])[0].get("description", "N/A")
-            result = f"""🌤️ Weather for {location}:
+    except Exception as e:
+        print(f"Error fetching weather: {str(e)}")
+        return _get_default_weather()
+
+
+@async_tool(get_local_weather)
+async def aget_local_weather(units: str = "C") -> str:
+    try:
+        if APIConfig.WEATHER_API_KEY:
+            url, params = _openweather_request(units)
+            data = await afetch_json(url, params=params, source="get_local_weather")
+            return _format_openweather(data, units)
+        
+        text = await afetch_text(WTTR_URL, source="get_local_weather")
+        return f"Weather:\n\n{text}"
+    except Exception as e:
+        print(f"Error fetching weather: {str(e)}")
+        return _get_default_weather()
+
+
+def _openweather_request(units: str):
+    url = f"{APIConfig.WEATHER_BASE_URL}/weather"
+    params = {
+        "q": APIConfig.DEFAULT_LOCATION,
+        "appid": APIConfig.WEATHER_API_KEY,
+        "units": "metric" if units == "C" else "imperial"
+    }
+    return url, params
+
+
+def _format_openweather(data: dict, units: str) -> str:
+    weather = data.get("main", {})
+    description = data.get("weather", [{}])[0].get("description", "N/A")
+    return f"""🌤️ Weather for {APIConfig.DEFAULT_LOCATION}:
             
 Temperature: {weather.get('temp', 'N/A')}°{units}
 Feels like: {weather.get('feels_like', 'N/A')}°{units}
 Condition: {description.capitalize()}
 Humidity: {weather.get('humidity', 'N/A')}%
 Wind Speed: {data.get('wind', {}).get('speed', 'N/A')} m/s"""
-            return result
-        else:
-            # Fallback to wttr.in (free, no key required)
-            url = f"https://wttr.in?format=3"
-            response = requests.get(url, timeout=APIConfig.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return f"Weather:\n\n{response.text}"
-            
-    except Exception as e:
-        print(f"Error fetching weather: {str(e)}")
-        return _get_default_weather()
 
 
 def _get_default_weather() -> str:
@@ -1,118 +1,855 @@
 """Utility functions for LangChain tools with caching and async support."""
 
+import asyncio
+import hashlib
 import json
+import sys
+import threading
 import time
+import urllib.parse
 import httpx
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Callable, Awaitable, Tuple, Union
 from functools import lru_cache
+from .http_client import get_client, get_async_client
+from .bulkhead import Bulkhead, BulkheadFull, bulkhead_for
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, breaker_for
+from .deadline import DeadlineExceeded, remaining as deadline_remaining
+from .hedging import budget_for, hedge_delay
+from .rate_limit import RateLimited, budget_for as rate_budget_for
+from .singleflight import SingleFlight
+from .cache import TTLCache, CacheSweeper, CacheEntry
+from .disk_cache import DiskCache
+from .cache_policy import CachePolicy, policy_for
+from . import metrics
 
-# Simple in-memory cache with TTL
-_cache = {}
-_cache_ttl = {}
-DEFAULT_CACHE_TTL = 300  # 5 minutes
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import APIConfig
+
+# Bounded in-memory cache with a soft TTL (fresh) and a hard TTL (servable while stale)
+_cache = TTLCache(max_bytes=APIConfig.CACHE_MAX_BYTES, stripes=APIConfig.CACHE_LOCK_STRIPES,
+                  compress_after=APIConfig.CACHE_COMPRESS_AFTER,
+                  compress_min_bytes=APIConfig.CACHE_COMPRESS_MIN_BYTES)
+_sweeper = CacheSweeper(_cache, interval=APIConfig.CACHE_SWEEP_INTERVAL)
+_disk: Optional[DiskCache] = None
+# Bump when parse_rss output changes so cached parsed feeds are not reused
+PARSER_VERSION = 2
+DEFAULT_CACHE_TTL = APIConfig.CACHE_DEFAULT_TTL  # per-source TTLs come from APIConfig.CACHE_TTL_POLICY
+_flights = SingleFlight()
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+# Background revalidation: a small pool for sync callers, tracked tasks for async ones
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+_refresh_tasks = set()
+# Sync fetches under a deadline: their own pool, with a slot per thread so nothing queues
+_deadline_executor = ThreadPoolExecutor(max_workers=APIConfig.DEADLINE_FETCH_WORKERS,
+                                        thread_name_prefix="deadline-fetch")
+_deadline_slots = threading.BoundedSemaphore(APIConfig.DEADLINE_FETCH_WORKERS)
+# Change notifications: callbacks run with the cache key whenever a fetch stores a new value
+_change_listeners: List[Callable[[str], None]] = []
+# Cache keys read inside a track_cache_keys() block
+_touched_keys: ContextVar[Optional[set]] = ContextVar("touched_cache_keys", default=None)
+# Disk writes happen off the request path, in order, on a single thread
+_disk_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-disk")
+# Disk reads for async callers, so SQLite (and its busy timeout) never blocks the event loop
+_disk_reader = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-disk-read")
+_disk_lock = threading.Lock()
+
+def _disk_tier() -> Optional[DiskCache]:
+    """Open the persistent tier on first use; None when disabled or unavailable."""
+    global _disk
+    if _disk is None and APIConfig.CACHE_DISK_ENABLED:
+        with _disk_lock:
+            if _disk is None and APIConfig.CACHE_DISK_ENABLED:
+                try:
+                    _disk = DiskCache(APIConfig.CACHE_DISK_PATH)
+                except Exception as e:
+                    print(f"Disk cache disabled: {str(e)}")
+                    APIConfig.CACHE_DISK_ENABLED = False
+    return _disk
+
+def _load_from_disk(key: str) -> Optional[CacheEntry]:
+    """Promote a persisted entry into memory on a miss, keeping its original expiry."""
+    disk = _disk_tier()
+    if disk is None:
+        return None
+    try:
+        stored = disk.get(key)
+    except Exception:
+        return None
+    if stored is None:
+        return None
+    metrics.increment("cache.disk_hit")
+    now = time.time()
+    return _cache.set(
+        key,
+        stored["value"],
+        stored["expires_at"] - now,
+        stale_window=stored["stale_until"] - stored["expires_at"],
+        namespace=_namespace(key),
+        validators=stored["validators"],
+        digest=stored["digest"],
+    )
+
+def _write_to_disk(key: str, entry: CacheEntry):
+    disk = _disk_tier()
+    if disk is None:
+        return
+    
+    def _write():
+        try:
+            disk.set(key, entry)
+        except Exception as e:
+            print(f"Error writing disk cache: {str(e)}")
+    
+    _disk_writer.submit(_write)
+
+def _namespace(key: str) -> str:
+    """Accounting namespace for a cache key, e.g. ``xml:news.google.com``."""
+    kind, _, url = key.partition(":")
+    return f"{kind}:{urllib.parse.urlsplit(url).hostname or ''}"
+
+def _lookup(key: str) -> Tuple[Optional[Any], Optional[str]]:
+    """Return (value, state) where state is FRESH, STALE, EXPIRED or None on a miss.
+
+    Memory misses fall through to the persistent tier, so entries written
+    before a restart (or by another worker) are served without an upstream call.
+    """
+    return _state(_cache.get(key) or _load_from_disk(key))
+
+async def _alookup(key: str) -> Tuple[Optional[Any], Optional[str]]:
+    """Async counterpart of _lookup; the persistent tier is read on a worker thread."""
+    entry = _cache.get(key)
+    if entry is None and APIConfig.CACHE_DISK_ENABLED:
+        entry = await asyncio.get_running_loop().run_in_executor(_disk_reader, _load_from_disk, key)
+    return _state(entry)
+
+def _state(entry: Optional[CacheEntry]) -> Tuple[Optional[Any], Optional[str]]:
+    if entry is None:
+        return None, None
+    now = time.time()
+    if now < entry.expires_at:
+        return entry.value, FRESH
+    if now < entry.stale_until:
+        return entry.value, STALE
+    return entry.value, EXPIRED
 
 def _get_cached(key: str, ttl: int = DEFAULT_CACHE_TTL) -> Optional[Any]:
     """Get cached value if not expired."""
-    if key in _cache and key in _cache_ttl:
-        if time.time() < _cache_ttl[key]:
-            return _cache[key]
+    value, state = _lookup(key)
+    return value if state == FRESH else None
+
+def _set_cached(key: str, value: Any, ttl: int = DEFAULT_CACHE_TTL, stale_window: int = 0,
+                validators: Dict[str, str] = None, digest: str = None):
+    """Set cached value with TTL, servable for stale_window more seconds while revalidating."""
+    entry = _cache.set(key, value, ttl, stale_window=stale_window, namespace=_namespace(key),
+                       validators=validators, digest=digest)
+    if entry is not None:
+        _write_to_disk(key, entry)
+
+def start_cache_sweeper():
+    """Start proactively dropping expired entries (called on app startup)."""
+    _sweeper.start()
+    disk = _disk_tier()
+    if disk is not None:
+        try:
+            disk.purge(APIConfig.CACHE_DISK_MAX_AGE)
+        except Exception as e:
+            print(f"Error purging disk cache: {str(e)}")
+
+def stop_cache_sweeper():
+    _sweeper.stop()
+
+def cache_stats() -> Dict[str, Any]:
+    """Entry counts and memory use of the fetch cache, overall and per namespace."""
+    return _cache.stats()
+
+class ResponseTooLarge(httpx.HTTPError):
+    """An upstream body exceeded its size budget and the download was aborted."""
+
+
+def _size_budget(host: str) -> Tuple[int, bool]:
+    """Maximum body size for a host and whether to truncate (rather than abort) past it."""
+    limit = APIConfig.RESPONSE_SIZE_LIMITS.get(host, APIConfig.RESPONSE_MAX_BYTES)
+    return limit, host in APIConfig.RESPONSE_TRUNCATE_HOSTS
+
+def _check_declared_size(response: httpx.Response, limit: int, truncate: bool):
+    """Abort before reading when Content-Length already exceeds the budget."""
+    declared = response.headers.get("content-length")
+    if not truncate and declared and declared.isdigit() and "content-encoding" not in response.headers \
+            and int(declared) > limit:
+        metrics.increment("download.aborted")
+        raise ResponseTooLarge(f"{response.url.host}: Content-Length {declared} exceeds {limit} bytes")
+
+def _accept_chunk(response: httpx.Response, chunks: List[bytes], received: int, chunk: bytes,
+                  limit: int, truncate: bool) -> Tuple[int, bool]:
+    """Append a streamed chunk within budget; returns (bytes received, whether to stop reading)."""
+    if received + len(chunk) <= limit:
+        chunks.append(chunk)
+        return received + len(chunk), False
+    if not truncate:
+        metrics.increment("download.aborted")
+        raise ResponseTooLarge(f"{response.url.host}: body exceeds {limit} bytes")
+    metrics.increment("download.truncated")
+    chunks.append(chunk[:limit - received])
+    return limit, True
+
+def _buffered(response: httpx.Response, chunks: List[bytes]) -> httpx.Response:
+    """A fully-read copy of a streamed response holding the accepted (decoded) body."""
+    headers = [(k, v) for k, v in response.headers.multi_items()
+               if k not in ("content-encoding", "content-length", "transfer-encoding")]
+    buffered = httpx.Response(response.status_code, headers=headers, content=b"".join(chunks),
+                              request=response.request, extensions=response.extensions)
+    quota = rate_budget_for(response.url.host)
+    if quota is not None:
+        quota.observe(buffered)
+    if buffered.status_code != 304:
+        buffered.raise_for_status()
+    return buffered
+
+def _timeout_profile(host: str) -> Dict[str, float]:
+    return APIConfig.HTTP_TIMEOUT_PROFILES.get(host, APIConfig.HTTP_TIMEOUT_DEFAULT)
+
+def _timeout_for(host: str, timeout: Optional[float] = None) -> httpx.Timeout:
+    """The host's connect/read timeout profile, unless the caller gave an explicit timeout."""
+    if timeout is not None:
+        return httpx.Timeout(timeout)
+    profile = _timeout_profile(host)
+    return httpx.Timeout(profile["read"], connect=profile["connect"])
+
+def _wait_budget(url: str, timeout: Optional[float] = None) -> float:
+    """How long a coalesced caller waits on another caller's fetch of url."""
+    if timeout is not None:
+        return timeout
+    profile = _timeout_profile(urllib.parse.urlsplit(url).hostname or "")
+    return profile["connect"] + profile["read"]
+
+def _queue_timeout() -> float:
+    """How long to wait for a bulkhead slot: BULKHEAD_QUEUE_TIMEOUT, cut short by the caller's deadline."""
+    budget = deadline_remaining()
+    return APIConfig.BULKHEAD_QUEUE_TIMEOUT if budget is None else min(budget, APIConfig.BULKHEAD_QUEUE_TIMEOUT)
+
+def _enter_bulkhead(host: str) -> Bulkhead:
+    """Wait for one of the host's bulkhead slots, raising BulkheadFull if it stays busy."""
+    bulkhead = bulkhead_for(host)
+    try:
+        bulkhead.acquire(_queue_timeout())
+    except BulkheadFull:
+        metrics.increment("bulkhead.rejected")
+        raise
+    return bulkhead
+
+async def _aenter_bulkhead(host: str) -> Bulkhead:
+    bulkhead = bulkhead_for(host)
+    try:
+        await bulkhead.aacquire(_queue_timeout())
+    except BulkheadFull:
+        metrics.increment("bulkhead.rejected")
+        raise
+    return bulkhead
+
+def _admit(host: str) -> CircuitBreaker:
+    """The host's breaker, raising CircuitOpenError when it is rejecting calls."""
+    breaker = breaker_for(host)
+    if not breaker.allow():
+        metrics.increment("breaker.rejected")
+        raise CircuitOpenError(f"{host}: circuit open, upstream recently failing")
+    return breaker
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    """Timeouts, connection errors, oversized bodies, 5xx and 429 count against a breaker; other 4xx don't."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, (httpx.TransportError, ResponseTooLarge))
+
+def _spend_quota(cache_key: str, url: str, previous: Optional[CacheEntry]):
+    """Raise RateLimited if the host's quota can't be spent on this fetch now (see tools.rate_limit)."""
+    host = urllib.parse.urlsplit(url).hostname or ""
+    quota = rate_budget_for(host)
+    if quota is None:
+        return
+    reason = quota.admit(cache_key, refresh=previous is not None, conditional=bool(previous and previous.validators))
+    if reason is not None:
+        metrics.increment("ratelimit.deferred" if previous is not None else "ratelimit.rejected")
+        raise RateLimited(f"{host}: {reason}")
+
+def _record_use(cache_key: str, url: str):
+    """Count demand for cache_key, which ranks it for a rate-limited host's reserved quota."""
+    quota = rate_budget_for(urllib.parse.urlsplit(url).hostname or "")
+    if quota is not None:
+        quota.record_use(cache_key)
+
+def _record_outcome(breaker: CircuitBreaker, began: float, error: Optional[BaseException] = None):
+    latency = time.perf_counter() - began
+    if error is None:
+        breaker.record_success(latency)
+    elif isinstance(error, Exception) and not _is_upstream_failure(error):
+        # Not the host's fault (e.g. a 404): healthy, but only successful responses are timed
+        breaker.record_success()
+    elif isinstance(error, Exception):
+        if breaker.record_failure():
+            metrics.increment("breaker.opened")
+            print(f"Circuit opened for {breaker.host}: {str(error)}")
+    else:
+        breaker.release()
+
+def _get(url: str, headers: dict = None, timeout: float = None, params: dict = None) -> httpx.Response:
+    """GET a URL over the shared keep-alive pool and raise on HTTP errors (304 is not an error).
+
+    The body is streamed and capped at the host's size budget (see
+    APIConfig.RESPONSE_SIZE_LIMITS), so a runaway upstream can't exhaust memory.
+    Timeouts come from the host's profile and calls go through its circuit
+    breaker, which raises CircuitOpenError at once while the host is failing,
+    and its bulkhead, which caps concurrent calls (BulkheadFull when full).
+    """
+    host = urllib.parse.urlsplit(url).hostname or ""
+    bulkhead = _enter_bulkhead(host)
+    try:
+        return _get_admitted(host, url, headers, timeout, params)
+    finally:
+        bulkhead.release()
+
+def _get_admitted(host: str, url: str, headers: Optional[dict], timeout: Optional[float],
+                  params: Optional[dict]) -> httpx.Response:
+    limit, truncate = _size_budget(host)
+    breaker = _admit(host)
+    began = time.perf_counter()
+    chunks: List[bytes] = []
+    received = 0
+    try:
+        with get_client().stream("GET", url, params=params, headers=headers,
+                                 timeout=_timeout_for(host, timeout)) as response:
+            _check_declared_size(response, limit, truncate)
+            for chunk in response.iter_bytes():
+                received, done = _accept_chunk(response, chunks, received, chunk, limit, truncate)
+                if done:
+                    break
+        buffered = _buffered(response, chunks)
+    except BaseException as e:
+        _record_outcome(breaker, began, e)
+        raise
+    _record_outcome(breaker, began)
+    return buffered
+
+async def _aget(url: str, headers: dict = None, timeout: float = None, params: dict = None) -> httpx.Response:
+    """Async counterpart of _get on the shared async pool, hedged for hosts in APIConfig.HEDGE_HOSTS.
+
+    If the first attempt hasn't answered by the host's observed p95 latency
+    and its hedge budget allows, a second identical GET is sent and whichever
+    succeeds first is returned; the other attempt is cancelled.
+    """
+    host = urllib.parse.urlsplit(url).hostname or ""
+    attempt = lambda: _aget_once(host, url, headers, timeout, params)
+    delay = hedge_delay(host)
+    if delay is None:
+        return await attempt()
+    budget = budget_for(host)
+    budget.deposit()
+    first = asyncio.ensure_future(attempt())
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done or not budget.try_spend():
+            return await first
+        metrics.increment("hedge.sent")
+        second = asyncio.ensure_future(attempt())
+        try:
+            return await _first_success(first, second)
+        finally:
+            second.cancel()
+    finally:
+        first.cancel()
+
+async def _first_success(first: asyncio.Future, second: asyncio.Future) -> httpx.Response:
+    """Result of whichever attempt succeeds first; the first attempt's error if both fail."""
+    pending = {first, second}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if not task.cancelled() and task.exception() is None:
+                if task is second:
+                    metrics.increment("hedge.won")
+                return task.result()
+    return first.result()
+
+async def _aget_once(host: str, url: str, headers: Optional[dict], timeout: Optional[float],
+                     params: Optional[dict]) -> httpx.Response:
+    bulkhead = await _aenter_bulkhead(host)
+    try:
+        return await _aget_admitted(host, url, headers, timeout, params)
+    finally:
+        bulkhead.release()
+
+async def _aget_admitted(host: str, url: str, headers: Optional[dict], timeout: Optional[float],
+                         params: Optional[dict]) -> httpx.Response:
+    limit, truncate = _size_budget(host)
+    breaker = _admit(host)
+    began = time.perf_counter()
+    chunks: List[bytes] = []
+    received = 0
+    try:
+        async with get_async_client().stream("GET", url, params=params, headers=headers,
+                                             timeout=_timeout_for(host, timeout)) as response:
+            _check_declared_size(response, limit, truncate)
+            async for chunk in response.aiter_bytes():
+                received, done = _accept_chunk(response, chunks, received, chunk, limit, truncate)
+                if done:
+                    break
+        buffered = _buffered(response, chunks)
+    except BaseException as e:
+        _record_outcome(breaker, began, e)
+        raise
+    _record_outcome(breaker, began)
+    return buffered
+
+def _decode_json(response: httpx.Response) -> Any:
+    return response.json()
+
+def _decode_text(response: httpx.Response) -> str:
+    return response.text
+
+def _decode_feed(response: httpx.Response) -> Tuple[Dict[str, Any], ...]:
+    # Raw bytes let the parser honour the feed's declared encoding
+    return tuple(parse_rss(response.content, limit=APIConfig.FEED_ITEM_LIMIT))
+
+def _conditional_headers(previous: Optional[CacheEntry], headers: dict = None) -> Optional[dict]:
+    """Add If-None-Match / If-Modified-Since from a previous entry's validators."""
+    if previous is None or not previous.validators:
+        return headers
+    conditional = dict(headers or {})
+    if "etag" in previous.validators:
+        conditional["If-None-Match"] = previous.validators["etag"]
+    if "last-modified" in previous.validators:
+        conditional["If-Modified-Since"] = previous.validators["last-modified"]
+    return conditional
+
+def _store_response(cache_key: str, policy: CachePolicy, response: httpx.Response, decode: Callable,
+                    previous: Optional[CacheEntry]) -> Any:
+    """Cache a fresh or revalidated response, reusing the previous value when unchanged.
+
+    A 304 keeps the previous value outright. Otherwise the raw body is hashed
+    and, for servers that send no validators, an unchanged hash skips decoding.
+    """
+    validators = {
+        name: response.headers[name] for name in ("etag", "last-modified") if name in response.headers
+    }
+    if response.status_code == 304 and previous is not None:
+        metrics.increment("revalidate.not_modified")
+        value, digest = previous.value, previous.digest
+        validators = {**previous.validators, **validators}
+    else:
+        digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        if previous is not None and previous.digest == digest:
+            metrics.increment("revalidate.unchanged_body")
+            value = previous.value
         else:
-            # Expired, remove from cache
-            del _cache[key]
-            del _cache_ttl[key]
-    return None
-
-def _set_cached(key: str, value: Any, ttl: int = DEFAULT_CACHE_TTL):
-    """Set cached value with TTL."""
-    _cache[key] = value
-    _cache_ttl[key] = time.time() + ttl
-
-def fetch_json(url: str, headers: dict = None, timeout: int = 5) -> dict:
-    """Fetch JSON from URL with caching."""
-    cache_key = f"json:{url}"
-    cached = _get_cached(cache_key)
-    if cached is not None:
-        return cached
-    
+            value = decode(response)
+    if _is_empty(value):
+        # An empty feed or result is often a transient upstream glitch; keep it only briefly
+        metrics.increment("negative.empty")
+        _set_cached(cache_key, value, ttl=policy.negative_ttl, validators=validators, digest=digest)
+        return value
+    _set_cached(cache_key, value, ttl=policy.jittered_ttl(), stale_window=policy.stale_window,
+                validators=validators, digest=digest)
+    if previous is None or previous.digest != digest:
+        _notify_change(cache_key)
+    return value
+
+def add_change_listener(callback: Callable[[str], None]):
+    """Call callback(cache_key) whenever a fetch caches a value that differs from the previous one.
+
+    Callbacks run on whichever thread or event loop stored the value and must be quick.
+    """
+    _change_listeners.append(callback)
+
+def remove_change_listener(callback: Callable[[str], None]):
+    if callback in _change_listeners:
+        _change_listeners.remove(callback)
+
+def _notify_change(cache_key: str):
+    for callback in list(_change_listeners):
+        try:
+            callback(cache_key)
+        except Exception as e:
+            print(f"Cache change listener failed: {e}")
+
+@contextmanager
+def track_cache_keys():
+    """Collect the cache keys that fetches inside the block read, e.g. to learn what a tool depends on."""
+    keys = set()
+    token = _touched_keys.set(keys)
     try:
-        with httpx.Client(timeout=timeout) as client:
-            headers = headers or {"User-Agent": "daily-log-api-langchain/2.0"}
-            response = client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            data = response.json()
-            _set_cached(cache_key, data)
-            return data
+        yield keys
+    finally:
+        _touched_keys.reset(token)
+
+def cache_versions(keys: Iterable[str]) -> Optional[Dict[str, str]]:
+    """Body digests of the given cache keys if every one is cached and fresh, else None."""
+    now = time.time()
+    versions = {}
+    for key in keys:
+        entry = _cache.get(key)
+        if entry is None or now >= entry.expires_at or entry.digest is None:
+            return None
+        versions[key] = entry.digest
+    return versions
+
+def _record_touch(cache_key: str):
+    keys = _touched_keys.get()
+    if keys is not None:
+        keys.add(cache_key)
+
+class UpstreamUnavailable(httpx.HTTPError):
+    """The upstream failed recently (negatively cached); the request was not sent."""
+
+
+def _negative_key(cache_key: str) -> str:
+    return f"negative|{cache_key}"
+
+def _remember_failure(cache_key: str, url: str, policy: CachePolicy, error: Exception):
+    """Negatively cache a failed fetch so callers skip the upstream for policy.negative_ttl."""
+    # Not the upstream's answer: the breaker, bulkhead, quota or a deadline stopped the wait,
+    # and the fetch may still succeed
+    if isinstance(error, (CircuitOpenError, BulkheadFull, RateLimited, DeadlineExceeded, FutureTimeoutError)) or not policy.negative_ttl:
+        return
+    metrics.increment("negative.error")
+    _cache.set(_negative_key(cache_key), f"{type(error).__name__}: {(str(error).splitlines() or [''])[0]}", policy.negative_ttl,
+               namespace=f"negative:{urllib.parse.urlsplit(url).hostname or ''}")
+
+def _recent_failure(cache_key: str) -> Optional[str]:
+    """The error of a failed fetch of cache_key still within its negative TTL, if any."""
+    entry = _cache.get(_negative_key(cache_key))
+    if entry is None or time.time() >= entry.expires_at:
+        return None
+    return entry.value
+
+def _is_empty(value: Any) -> bool:
+    return isinstance(value, (list, tuple, dict, str)) and not value
+
+def _load(cache_key: str, url: str, decode: Callable, headers: dict, timeout: Optional[float],
+          policy: CachePolicy, params: Optional[dict] = None) -> Any:
+    previous = _cache.get(cache_key)
+    try:
+        _spend_quota(cache_key, url, previous)
+        response = _get(url, headers=_conditional_headers(previous, headers), timeout=timeout, params=params)
+        value = _store_response(cache_key, policy, response, decode, previous)
     except Exception as e:
-        # Return cached data even if expired, better than nothing
-        if cache_key in _cache:
-            return _cache[cache_key]
+        _remember_failure(cache_key, url, policy, e)
         raise
+    _cache.delete(_negative_key(cache_key))
+    return value
 
-def fetch_text(url: str, timeout: int = 5) -> str:
-    """Fetch text from URL with caching."""
-    cache_key = f"text:{url}"
-    cached = _get_cached(cache_key)
-    if cached is not None:
+async def _aload(cache_key: str, url: str, decode: Callable, headers: dict, timeout: Optional[float],
+                 policy: CachePolicy, params: Optional[dict] = None) -> Any:
+    previous = _cache.get(cache_key)
+    try:
+        _spend_quota(cache_key, url, previous)
+        response = await _aget(url, headers=_conditional_headers(previous, headers), timeout=timeout,
+                               params=params)
+        value = _store_response(cache_key, policy, response, decode, previous)
+    except Exception as e:
+        _remember_failure(cache_key, url, policy, e)
+        raise
+    _cache.delete(_negative_key(cache_key))
+    return value
+
+def _refresh_in_background(cache_key: str, load: Callable[[], Any]):
+    """Revalidate a stale entry off the request path; failures keep the stale value."""
+    if _flights.in_flight(cache_key):
+        return
+    
+    def _run():
+        try:
+            _flights.do(cache_key, lambda: _load_unless_fresh(cache_key, load))
+        except Exception:
+            pass
+    
+    _refresh_executor.submit(_run)
+
+def _arefresh_in_background(cache_key: str, load: Callable[[], Awaitable[Any]]):
+    """Async counterpart of _refresh_in_background, scheduled on the running loop."""
+    if _flights.in_flight(cache_key):
+        return
+    
+    async def _run():
+        try:
+            await _flights.ado(cache_key, lambda: _aload_unless_fresh(cache_key, load))
+        except Exception:
+            pass
+    
+    task = asyncio.ensure_future(_run())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+def _within_deadline(fetch: Callable[[], Any]) -> Any:
+    """Run fetch, giving up with DeadlineExceeded when the caller's deadline passes.
+
+    Under a deadline fetch runs on the deadline pool, so it keeps going and
+    still populates the cache after the caller has moved on. The pool takes
+    one fetch per thread and never queues: while it is full the caller waits
+    for a slot within its budget, and gives up without starting the fetch if
+    none frees up.
+    """
+    budget = deadline_remaining()
+    if budget is None:
+        return fetch()
+    if not _deadline_slots.acquire(timeout=budget):
+        metrics.increment("deadline.exceeded")
+        metrics.increment("deadline.pool_full")
+        raise DeadlineExceeded(f"no fetch slot free within the {budget:.3f}s left")
+    future = _deadline_executor.submit(_holding_deadline_slot, fetch)
+    budget = deadline_remaining()
+    try:
+        return future.result(timeout=budget)
+    except FutureTimeoutError:
+        metrics.increment("deadline.exceeded")
+        raise DeadlineExceeded(f"no upstream response within the {budget:.3f}s left") from None
+
+def _holding_deadline_slot(fetch: Callable[[], Any]) -> Any:
+    try:
+        return fetch()
+    finally:
+        _deadline_slots.release()
+
+def _load_unless_fresh(cache_key: str, load: Callable[[], Any]) -> Any:
+    """load(), unless the entry turned fresh since the caller looked (e.g. while its fetch waited to start)."""
+    value, state = _lookup(cache_key)
+    if state == FRESH:
+        return value
+    return load()
+
+async def _aload_unless_fresh(cache_key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """Async counterpart of _load_unless_fresh."""
+    value, state = await _alookup(cache_key)
+    if state == FRESH:
+        return value
+    return await load()
+
+async def _awithin_deadline(fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Async counterpart of _within_deadline; the fetch continues as a task past the deadline."""
+    budget = deadline_remaining()
+    if budget is None:
+        return await fetch()
+    task = asyncio.ensure_future(fetch())
+    done, _ = await asyncio.wait({task}, timeout=budget)
+    if task in done:
+        return task.result()
+    _refresh_tasks.add(task)
+    task.add_done_callback(_discard_background)
+    metrics.increment("deadline.exceeded")
+    raise DeadlineExceeded(f"no upstream response within the {budget:.3f}s left")
+
+def _discard_background(task: asyncio.Task):
+    _refresh_tasks.discard(task)
+    if not task.cancelled():
+        task.exception()  # retrieved so an abandoned failure isn't logged as unhandled
+
+def _cache_url(url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> str:
+    """The cache-key form of a request: its URL with params folded in, in a stable order.
+
+    Credentials (params named in APIConfig.CACHE_KEY_SECRET_PARAMS, and
+    request headers such as Authorization) only contribute a digest, so
+    different keys get different entries but no secret reaches cache keys,
+    stats or the disk tier.
+    """
+    public, secret = [], []
+    for name, value in sorted((params or {}).items()):
+        if value is not None:
+            (secret if name.lower() in APIConfig.CACHE_KEY_SECRET_PARAMS else public).append((name, str(value)))
+    secret.extend(sorted((name.lower(), str(value)) for name, value in (headers or {}).items()))
+    key = url
+    if public:
+        key += ("&" if urllib.parse.urlsplit(url).query else "?") + urllib.parse.urlencode(public)
+    if secret:
+        key += "#" + hashlib.blake2b(repr(secret).encode(), digest_size=8).hexdigest()
+    return key
+
+def _fetch(kind: str, url: str, decode: Callable, headers: dict = None, timeout: float = None,
+           ttl: int = None, source: str = None, params: dict = None) -> Any:
+    """Fetch and decode a URL through the cache, falling back to stale data on failure.
+
+    Stale entries are returned immediately while a background refresh updates
+    them, and concurrent misses on the same key are coalesced into a single
+    upstream fetch. The TTL comes from the policy table unless ttl is given.
+    Under a deadline (see tools.deadline) the wait for upstream is cut short:
+    an expired entry is served if there is one, else DeadlineExceeded is
+    raised, and the fetch completes in the background either way. A fetch
+    that failed within the policy's negative TTL isn't retried: the old value
+    is served, or UpstreamUnavailable raised. Fetches that a rate-limited
+    host's quota can't cover (tools.rate_limit) likewise serve the old value
+    or raise RateLimited.
+    """
+    cache_key = f"{kind}:{_cache_url(url, params, headers)}"
+    policy = policy_for(url, source, ttl)
+    load = lambda: _load(cache_key, url, decode, headers, timeout, policy, params)
+    _record_use(cache_key, url)
+    _record_touch(cache_key)
+    cached, state = _lookup(cache_key)
+    if state == FRESH or (state is not None and APIConfig.CACHE_OFFLINE):
+        return cached
+    failure = _recent_failure(cache_key)
+    if failure is not None:
+        metrics.increment("negative.hit")
+        if state is not None:
+            return cached
+        raise UpstreamUnavailable(f"{url} failed recently ({failure})")
+    if state == STALE:
+        _refresh_in_background(cache_key, load)
         return cached
     
     try:
-        with httpx.Client(timeout=timeout) as client:
-            headers = {"User-Agent": "daily-log-api-langchain/2.0"}
-            response = client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            text = response.text
-            _set_cached(cache_key, text)
-            return text
+        return _within_deadline(lambda: _flights.do(cache_key, lambda: _load_unless_fresh(cache_key, load),
+                                                    timeout=_wait_budget(url, timeout)))
     except Exception as e:
-        if cache_key in _cache:
-            return _cache[cache_key]
+        # Return cached data even if expired (offline fallback), better than nothing
+        if state is not None:
+            return cached
         raise
 
-def fetch_xml(url: str, timeout: int = 5) -> str:
-    """Fetch XML from URL with caching."""
-    cache_key = f"xml:{url}"
-    cached = _get_cached(cache_key)
-    if cached is not None:
+async def _afetch(kind: str, url: str, decode: Callable, headers: dict = None, timeout: float = None,
+                 ttl: int = None, source: str = None, params: dict = None) -> Any:
+    """Async counterpart of _fetch sharing the same cache entries and in-flight fetches."""
+    cache_key = f"{kind}:{_cache_url(url, params, headers)}"
+    policy = policy_for(url, source, ttl)
+    load = lambda: _aload(cache_key, url, decode, headers, timeout, policy, params)
+    _record_use(cache_key, url)
+    _record_touch(cache_key)
+    cached, state = await _alookup(cache_key)
+    if state == FRESH or (state is not None and APIConfig.CACHE_OFFLINE):
+        return cached
+    failure = _recent_failure(cache_key)
+    if failure is not None:
+        metrics.increment("negative.hit")
+        if state is not None:
+            return cached
+        raise UpstreamUnavailable(f"{url} failed recently ({failure})")
+    if state == STALE:
+        _arefresh_in_background(cache_key, load)
         return cached
     
     try:
-        with httpx.Client(timeout=timeout) as client:
-            headers = {"User-Agent": "daily-log-api-langchain/2.0"}
-            response = client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            xml = response.text
-            _set_cached(cache_key, xml)
-            return xml
+        return await _awithin_deadline(lambda: _flights.ado(cache_key, load))
     except Exception as e:
-        if cache_key in _cache:
-            return _cache[cache_key]
+        if state is not None:
+            return cached
         raise
 
-def parse_rss(xml_text: str) -> List[Dict[str, Any]]:
-    """Parse RSS feed to list of items."""
+def fetch_json(url: str, headers: dict = None, timeout: float = None, ttl: int = None, source: str = None,
+               params: dict = None) -> dict:
+    """Fetch JSON from URL with caching.
+
+    params and headers (e.g. API keys, Authorization) are sent as given and
+    distinguish cache entries; source names the tool for per-source TTLs.
+    """
+    return _fetch("json", url, _decode_json, headers=headers, timeout=timeout, ttl=ttl, source=source,
+                  params=params)
+
+def fetch_text(url: str, timeout: float = None, ttl: int = None, source: str = None) -> str:
+    """Fetch text from URL with caching."""
+    return _fetch("text", url, _decode_text, timeout=timeout, ttl=ttl, source=source)
+
+def fetch_xml(url: str, timeout: float = None, ttl: int = None, source: str = None) -> str:
+    """Fetch XML from URL with caching."""
+    return _fetch("xml", url, _decode_text, timeout=timeout, ttl=ttl, source=source)
+
+async def afetch_json(url: str, headers: dict = None, timeout: float = None, ttl: int = None, source: str = None,
+                      params: dict = None) -> dict:
+    """Fetch JSON from URL with caching, without blocking the event loop."""
+    return await _afetch("json", url, _decode_json, headers=headers, timeout=timeout, ttl=ttl, source=source,
+                         params=params)
+
+async def afetch_text(url: str, timeout: float = None, ttl: int = None, source: str = None) -> str:
+    """Fetch text from URL with caching, without blocking the event loop."""
+    return await _afetch("text", url, _decode_text, timeout=timeout, ttl=ttl, source=source)
+
+async def afetch_xml(url: str, timeout: float = None, ttl: int = None, source: str = None) -> str:
+    """Fetch XML from URL with caching, without blocking the event loop."""
+    return await _afetch("xml", url, _decode_text, timeout=timeout, ttl=ttl, source=source)
+
+def fetch_feed(url: str, limit: int = None, timeout: float = None, ttl: int = None, source: str = None) -> List[Dict[str, Any]]:
+    """Fetch and parse an RSS feed with caching.
+
+    The cache holds the parsed items (keyed by URL and PARSER_VERSION) rather
+    than the raw XML, so hits skip parse_rss entirely. At most
+    APIConfig.FEED_ITEM_LIMIT items are parsed and kept per feed. Cached
+    items are shared between callers and must not be mutated.
+    """
+    items = _fetch(f"feed.v{PARSER_VERSION}", url, _decode_feed, timeout=timeout, ttl=ttl, source=source)
+    return list(items[:limit])
+
+async def afetch_feed(url: str, limit: int = None, timeout: float = None, ttl: int = None,
+                      source: str = None) -> List[Dict[str, Any]]:
+    """Async counterpart of fetch_feed."""
+    items = await _afetch(f"feed.v{PARSER_VERSION}", url, _decode_feed, timeout=timeout, ttl=ttl, source=source)
+    return list(items[:limit])
+
+def async_tool(sync_tool):
+    """Register a coroutine as the native async implementation of a @tool.
+
+    LangChain's ``ainvoke`` otherwise runs the sync function in a thread; with a
+    coroutine attached it awaits the non-blocking implementation directly.
+    """
+    def decorator(coroutine):
+        sync_tool.coroutine = coroutine
+        return coroutine
+    return decorator
+
+_FEED_ITEM_TAGS = {"item", "entry"}
+_FEED_DATE_TAGS = ("pubDate", "published", "updated", "date")
+_PARSE_CHUNK_SIZE = 64 * 1024
+
+def _local_name(tag: str) -> str:
+    """Strip an XML namespace: ``{http://www.w3.org/2005/Atom}entry`` -> ``entry``."""
+    return tag.rsplit("}", 1)[-1]
+
+def _feed_item(element: ET.Element) -> Dict[str, Any]:
+    """Extract title/link/pubDate from an RSS <item> or Atom <entry>."""
+    fields = {}
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "link" and "link" not in fields:
+            # RSS puts the URL in the text, Atom in href (prefer rel="alternate")
+            href = child.get("href")
+            if href is None:
+                fields["link"] = child.text or ""
+            elif child.get("rel", "alternate") == "alternate":
+                fields["link"] = href
+        elif name not in fields:
+            fields[name] = child.text or ""
+    return {
+        "title": fields.get("title", ""),
+        "link": fields.get("link", ""),
+        "pubDate": next((fields[tag] for tag in _FEED_DATE_TAGS if tag in fields), ""),
+    }
+
+def parse_rss(xml_text: Union[str, bytes], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Parse an RSS 2.0 / RSS 1.0 or Atom feed to a list of items.
+
+    The document is fed to an incremental parser in chunks; each item is
+    cleared once extracted and parsing stops as soon as ``limit`` items have
+    been read, so the rest of the feed is never parsed.
+    """
+    if limit is not None and limit <= 0:
+        return []
     try:
-        root = ET.fromstring(xml_text)
-        channel = root.find("channel")
-        if not channel:
-            for child in root:
-                if "channel" in child.tag:
-                    channel = child
-                    break
-        
+        parser = ET.XMLPullParser(events=("end",))
         items = []
-        if channel:
-            for item in channel.findall("item") or []:
-                title_el = item.find("title")
-                link_el = item.find("link")
-                pub_el = item.find("pubDate")
-                
-                items.append({
-                    "title": title_el.text if title_el is not None else "",
-                    "link": link_el.text if link_el is not None else "",
-                    "pubDate": pub_el.text if pub_el is not None else "",
-                })
-        
+        for start in range(0, len(xml_text), _PARSE_CHUNK_SIZE):
+            parser.feed(xml_text[start:start + _PARSE_CHUNK_SIZE])
+            for _, element in parser.read_events():
+                if _local_name(element.tag) in _FEED_ITEM_TAGS:
+                    items.append(_feed_item(element))
+                    element.clear()
+                    if limit is not None and len(items) >= limit:
+                        return items
+        parser.close()
         return items
     except Exception as e:
         raise ValueError(f"Failed to parse RSS: {str(e)}")
@@ -213,8 +213,30 @@ function HomeMenu({ onNavigate, homeWidgets }) {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
 
+  // Load the dashboard, then subscribe to live updates: the server pushes a
+  // section only when its data changes from the version loaded here
   useEffect(() => {
-    fetchHomeData();
+    const sections = ['weather', 'news', 'quote', 'books', 'articles', 'github', 'fashion', 'shopping', 'gas', 'food', 'events'];
+    let ws = null;
+    let closed = false;
+    fetchHomeData().then((versions) => {
+      if (closed) return;
+      ws = new WebSocket(`${API_BASE_URL.replace(/^http/, 'ws').replace(/\/api$/, '')}/ws/updates`);
+      ws.onopen = () => ws.send(JSON.stringify({ action: 'subscribe', topics: sections, since: versions }));
+      ws.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        if (message.type !== 'update') return;
+        setHomeData((prev) => ({
+          ...prev,
+          [message.topic]: message.data,
+          ...(message.topic === 'books' ? { trends: message.data } : {}),
+        }));
+      };
+    });
+    return () => {
+      closed = true;
+      if (ws) ws.close();
+    };
   }, []);
 
   const fetchHomeData = async () => {
@@ -222,49 +244,29 @@ function HomeMenu({ onNavigate, homeWidgets }) {
     setError(null);
     
     try {
-      // Fetch all data in parallel for faster loading
-      const [weatherRes, techNewsRes, quoteRes, booksRes, articlesRes, githubRes, fashionRes, shoppingRes, gasRes, foodRes, eventsRes] = await Promise.all([
-        fetch(`${API_BASE_URL}/weather`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/tech/trending`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/quotes/daily`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/books/trending`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/articles/medium`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/github/trending`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/fashion/trending`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/shopping/products`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/gas/prices`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/food/restaurants`).catch(() => ({ ok: false })),
-        fetch(`${API_BASE_URL}/events/nearby?location=New York, NY&radius=25&unit=miles&category=music`).catch(() => ({ ok: false }))
-      ]);
-
-      const weatherData = weatherRes.ok ? await weatherRes.json() : null;
-      const techNewsData = techNewsRes.ok ? await techNewsRes.json() : null;
-      const quoteData = quoteRes.ok ? await quoteRes.json() : null;
-      const booksData = booksRes.ok ? await booksRes.json() : null;
-      const articlesData = articlesRes.ok ? await articlesRes.json() : null;
-      const githubData = githubRes.ok ? await githubRes.json() : null;
-      const fashionData = fashionRes.ok ? await fashionRes.json() : null;
-      const shoppingData = shoppingRes.ok ? await shoppingRes.json() : null;
-      const gasData = gasRes.ok ? await gasRes.json() : null;
-      const foodData = foodRes.ok ? await foodRes.json() : null;
-      const eventsData = eventsRes.ok ? await eventsRes.json() : null;
+      // One request for every section; the server fetches them concurrently
+      const res = await fetch(`${API_BASE_URL}/dashboard`);
+      if (!res.ok) throw new Error(`Dashboard request failed (${res.status})`);
+      const { data, versions } = await res.json();
 
       setHomeData({
-        weather: weatherData?.data,
-        news: techNewsData?.data,
-        quote: quoteData?.data,
-        trends: booksData?.data,
-        articles: articlesData?.data,
-        books: booksData?.data,
-        github: githubData?.data,
-        fashion: fashionData?.data,
-        shopping: shoppingData?.data,
-        gas: gasData?.data,
-        food: foodData?.data,
-        events: eventsData?.data,
+        weather: data.weather,
+        news: data.news,
+        quote: data.quote,
+        trends: data.books,
+        articles: data.articles,
+        books: data.books,
+        github: data.github,
+        fashion: data.fashion,
+        shopping: data.shopping,
+        gas: data.gas,
+        food: data.food,
+        events: data.events,
       });
+      return versions || {};
     } catch (err) {
       setError(err.message);
+      return {};
     } finally {
       setLoading(false);
     }